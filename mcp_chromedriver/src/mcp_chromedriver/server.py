@@ -1,14 +1,28 @@
 import os
-from mcp.server.fastmcp import FastMCP
+import re
+import asyncio
+import time
+import json
+import atexit
+import base64
+import queue
+import shutil
+import tempfile
+import threading
+import uuid
+from datetime import datetime, timezone
+from urllib.parse import parse_qsl, urlparse
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Literal, Optional
+from mcp.server.fastmcp import FastMCP, Image
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import WebDriverException, NoSuchElementException
+from selenium.common.exceptions import WebDriverException, NoSuchElementException, SessionNotCreatedException
 from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.common.by import By
 from html2text import html2text
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 
 
@@ -18,7 +32,457 @@ CHROME_PROFILE_PATH = os.environ.get("CHROME_PROFILE_PATH", os.path.join(os.getc
 DEFAULT_DOWNLOAD_PATH = os.environ.get("DEFAULT_DOWNLOAD_PATH", os.getcwd())
 CHROMIUM_PATH = "/usr/bin/chromium-browser"
 
-driver = None  # Global variable to store the WebDriver instance
+# ChromeDriver resolution. ChromeDriverManager().install() does a version lookup (and
+# sometimes a download) on every call, so the resolved path is kept in memory and on disk.
+CHROMEDRIVER_PATH = os.environ.get("CHROMEDRIVER_PATH")  # Use this binary and skip webdriver_manager entirely
+CHROMEDRIVER_CACHE_FILE = os.environ.get("CHROMEDRIVER_CACHE_FILE", os.path.join(os.path.expanduser("~"), ".cache", "mcp_chromedriver", "driver_path.json"))
+CHROMEDRIVER_CACHE_TTL = float(os.environ.get("CHROMEDRIVER_CACHE_TTL", str(7 * 24 * 3600)))  # Seconds before the path is looked up again
+
+# Headless browsers launched ahead of time and handed out by launch_browser; 0 disables the pool.
+CHROME_WARM_POOL_SIZE = int(os.environ.get("CHROME_WARM_POOL_SIZE", "0"))
+
+# URL patterns for the block_resources presets of launch_browser, in Network.setBlockedURLs syntax.
+BLOCK_PRESETS = {
+    "images": ["*.png", "*.jpg", "*.jpeg", "*.gif", "*.webp", "*.avif", "*.svg", "*.ico", "*.bmp"],
+    "fonts": ["*.woff", "*.woff2", "*.ttf", "*.otf", "*.eot"],
+    "media": ["*.mp4", "*.webm", "*.ogg", "*.ogv", "*.mp3", "*.wav", "*.m4a", "*.mov", "*.m3u8", "*.mpd"],
+    "analytics": [
+        "*google-analytics.com*", "*googletagmanager.com*", "*analytics.google.com*", "*segment.io*",
+        "*cdn.segment.com*", "*hotjar.com*", "*mixpanel.com*", "*amplitude.com*", "*clarity.ms*",
+        "*newrelic.com*", "*nr-data.net*", "*fullstory.com*", "*heapanalytics.com*", "*connect.facebook.net*",
+    ],
+    "ads": [
+        "*doubleclick.net*", "*googlesyndication.com*", "*googleadservices.com*", "*adservice.google.*",
+        "*adnxs.com*", "*amazon-adsystem.com*", "*taboola.com*", "*outbrain.com*", "*criteo.com*",
+        "*criteo.net*", "*pubmatic.com*", "*rubiconproject.com*", "*moatads.com*", "*scorecardresearch.com*",
+    ],
+}
+
+# Browser sessions: each session_id owns its own Chrome instance and profile directory.
+MAX_SESSIONS = int(os.environ.get("CHROME_MAX_SESSIONS", "4"))  # Least recently used session is closed beyond this
+SESSION_IDLE_TIMEOUT = float(os.environ.get("CHROME_SESSION_IDLE_TIMEOUT", "1800"))  # Seconds; 0 disables idle reaping
+DEFAULT_SESSION_ID = "default"
+
+_SESSION_ID_PATTERN = re.compile(r"^[A-Za-z0-9_.-]{1,64}$")
+
+
+class BrowserSession:
+    """
+    A launched Chrome instance and the bookkeeping the session manager needs for it.
+    """
+
+    def __init__(self, session_id: str, driver, profile_path: str, headless: bool, temporary_profile: bool = False,
+                 page_load_strategy: str = "normal", blocked_urls: Optional[List[str]] = None, network_logging: bool = False):
+        self.session_id = session_id
+        self.driver = driver
+        self.profile_path = profile_path
+        self.headless = headless
+        self.temporary_profile = temporary_profile  # Deleted when the browser quits
+        self.page_load_strategy = page_load_strategy
+        self.blocked_urls = blocked_urls or []  # Applied to every tab the tools open or switch to
+        self.network_logging = network_logging  # Launched with Chrome's performance log, needed for network capture
+        self.network_capture_started = None  # time.time() of start_network_capture, or None when not capturing
+        self.created_at = time.time()
+        self.last_used = self.created_at
+
+
+class SessionManager:
+    """
+    Holds the named browser sessions of the server.
+
+    At most `max_sessions` sessions are kept; launching one more closes the least
+    recently used session. Slots can also be reserved ahead of a launch that must
+    not close anybody else's session. Sessions that have not been used for
+    `idle_timeout` seconds are closed by a background reaper thread, and also
+    whenever the manager is accessed.
+    """
+
+    def __init__(self, max_sessions: int, idle_timeout: float):
+        self.max_sessions = max_sessions
+        self.idle_timeout = idle_timeout
+        self._sessions = OrderedDict()  # session_id -> BrowserSession, least recently used first
+        self._reserved = 0  # Free slots promised to launches made with add(..., reserved=True)
+        self._lock = threading.RLock()
+        self._reaper = None
+
+    def get(self, session_id: str):
+        """
+        Returns the driver of `session_id` and marks the session as used, or None if there is no such session.
+        """
+        session = self.get_session(session_id)
+        return session.driver if session is not None else None
+
+    def get_session(self, session_id: str) -> Optional[BrowserSession]:
+        """
+        Returns the BrowserSession of `session_id` and marks it as used, or None if there is no such session.
+        """
+        self.reap_idle()
+        with self._lock:
+            session = self._sessions.get(session_id)
+            if session is None:
+                return None
+            session.last_used = time.time()
+            self._sessions.move_to_end(session_id)
+            return session
+
+    def reserve(self, count: int) -> int:
+        """
+        Reserves up to `count` free session slots without closing any session.
+
+        Returns:
+            The number of slots reserved, which may be 0. Each one is used up by an
+            add(..., reserved=True) call or handed back with release().
+        """
+        self.reap_idle()
+        with self._lock:
+            free = max(self.max_sessions, 1) - len(self._sessions) - self._reserved
+            reserved = max(min(count, free), 0)
+            self._reserved += reserved
+            return reserved
+
+    def release(self, count: int) -> None:
+        """
+        Hands back `count` reserved slots that will not be used.
+        """
+        with self._lock:
+            self._reserved = max(self._reserved - count, 0)
+
+    def add(self, session_id: str, driver, profile_path: str, headless: bool, temporary_profile: bool = False,
+            page_load_strategy: str = "normal", blocked_urls: Optional[List[str]] = None, network_logging: bool = False,
+            reserved: bool = False) -> list:
+        """
+        Registers a newly launched driver under `session_id`.
+
+        A browser already running under the same id is quit first. With `reserved`,
+        the session takes a slot reserved with reserve(); otherwise least recently
+        used sessions are closed until the new one fits under `max_sessions`
+        alongside the reserved slots.
+
+        Returns:
+            The ids of the sessions that were evicted to make room.
+        """
+        evicted = []
+        with self._lock:
+            previous = self._sessions.pop(session_id, None)
+            if reserved:
+                self._reserved = max(self._reserved - 1, 0)
+            while not reserved and self._sessions and len(self._sessions) + self._reserved >= max(self.max_sessions, 1):
+                evicted_id, evicted_session = self._sessions.popitem(last=False)
+                evicted.append((evicted_id, evicted_session))
+            self._sessions[session_id] = BrowserSession(session_id, driver, profile_path, headless, temporary_profile,
+                                                        page_load_strategy, blocked_urls, network_logging)
+            self._start_reaper()
+        if previous is not None and previous.driver is not driver:
+            _discard_session(previous)
+        for _, evicted_session in evicted:
+            _discard_session(evicted_session)
+        return [evicted_id for evicted_id, _ in evicted]
+
+    def close(self, session_id: str) -> bool:
+        """
+        Quits the browser of `session_id` and forgets the session.
+
+        Returns:
+            False if there was no such session.
+        """
+        with self._lock:
+            session = self._sessions.pop(session_id, None)
+        if session is None:
+            return False
+        try:
+            session.driver.quit()
+        finally:
+            if session.temporary_profile:
+                shutil.rmtree(session.profile_path, ignore_errors=True)
+        return True
+
+    def close_all(self) -> None:
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            _discard_session(session)
+
+    def reap_idle(self) -> list:
+        """
+        Closes every session that has been idle for longer than `idle_timeout`.
+
+        Returns:
+            The ids of the closed sessions.
+        """
+        if self.idle_timeout <= 0:
+            return []
+        cutoff = time.time() - self.idle_timeout
+        with self._lock:
+            idle = [session for session in self._sessions.values() if session.last_used < cutoff]
+            for session in idle:
+                del self._sessions[session.session_id]
+        for session in idle:
+            _discard_session(session)
+        return [session.session_id for session in idle]
+
+    def describe(self) -> list:
+        """
+        Returns a summary of every session, most recently used last.
+        """
+        now = time.time()
+        with self._lock:
+            return [
+                {
+                    "session_id": session.session_id,
+                    "headless": session.headless,
+                    "profile_path": session.profile_path,
+                    "page_load_strategy": session.page_load_strategy,
+                    "blocked_url_patterns": len(session.blocked_urls),
+                    "network_logging": session.network_logging,
+                    "capturing_network": session.network_capture_started is not None,
+                    "age_seconds": round(now - session.created_at, 1),
+                    "idle_seconds": round(now - session.last_used, 1),
+                }
+                for session in self._sessions.values()
+            ]
+
+    def _start_reaper(self) -> None:
+        # Called with the lock held. The reaper is a daemon thread so it never keeps the server alive.
+        if self._reaper is not None or self.idle_timeout <= 0:
+            return
+
+        def reap_forever():
+            while True:
+                time.sleep(min(max(self.idle_timeout / 4, 1), 60))
+                self.reap_idle()
+
+        self._reaper = threading.Thread(target=reap_forever, name="chrome-session-reaper", daemon=True)
+        self._reaper.start()
+
+
+def _quit_driver(driver, temporary_profile: Optional[str] = None) -> None:
+    # Quits a driver that is being discarded; a browser that already died is not an error here.
+    try:
+        driver.quit()
+    except Exception:
+        pass
+    if temporary_profile:
+        shutil.rmtree(temporary_profile, ignore_errors=True)
+
+
+def _discard_session(session: BrowserSession) -> None:
+    _quit_driver(session.driver, session.profile_path if session.temporary_profile else None)
+
+
+def _profile_path(session_id: str) -> str:
+    # The default session keeps using CHROME_PROFILE_PATH; Chrome refuses to share a profile between instances.
+    if session_id == DEFAULT_SESSION_ID:
+        return CHROME_PROFILE_PATH
+    return f"{CHROME_PROFILE_PATH}_{session_id}"
+
+
+def _browser_not_launched(session_id: str) -> str:
+    return f"Error: Browser not launched for session '{session_id}'. Please launch the browser first using the launch_browser tool."
+
+
+sessions = SessionManager(MAX_SESSIONS, SESSION_IDLE_TIMEOUT)
+atexit.register(sessions.close_all)
+
+_driver_path = None
+_driver_path_lock = threading.Lock()
+
+
+def _read_driver_path_cache() -> Optional[str]:
+    # Returns the path saved by an earlier run if it is recent and the binary is still there.
+    try:
+        with open(CHROMEDRIVER_CACHE_FILE) as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    path = cached.get("path")
+    if not path or time.time() - cached.get("resolved_at", 0) > CHROMEDRIVER_CACHE_TTL:
+        return None
+    if not os.access(path, os.X_OK):
+        return None
+    return path
+
+
+def _write_driver_path_cache(path: str) -> None:
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_CACHE_FILE), exist_ok=True)
+        temporary_file = f"{CHROMEDRIVER_CACHE_FILE}.{os.getpid()}.tmp"
+        with open(temporary_file, "w") as f:
+            json.dump({"path": path, "resolved_at": time.time()}, f)
+        os.replace(temporary_file, CHROMEDRIVER_CACHE_FILE)
+    except OSError:
+        pass  # The cache only saves time; failing to write it is not an error
+
+
+def _resolve_driver_path(refresh: bool = False) -> str:
+    """
+    Returns the path of the chromedriver binary.
+
+    The path from CHROMEDRIVER_PATH is used as is. Otherwise the path resolved by
+    webdriver_manager is reused from memory or from CHROMEDRIVER_CACHE_FILE, and
+    ChromeDriverManager().install() only runs when neither has a usable path,
+    the cached one is older than CHROMEDRIVER_CACHE_TTL, or `refresh` is set.
+    """
+    global _driver_path
+    if CHROMEDRIVER_PATH:
+        return CHROMEDRIVER_PATH
+    with _driver_path_lock:
+        if not refresh:
+            if _driver_path and os.access(_driver_path, os.X_OK):
+                return _driver_path
+            cached = _read_driver_path_cache()
+            if cached:
+                _driver_path = cached
+                return cached
+        _driver_path = ChromeDriverManager().install()
+        _write_driver_path_cache(_driver_path)
+        return _driver_path
+
+
+def _start_chrome(profile_path: str, headless: bool, page_load_strategy: str = "normal", network_logging: bool = False):
+    """
+    Starts a Chrome instance with the given profile directory and page load strategy, and returns its driver.
+
+    With `network_logging`, Chrome records DevTools Network.* events in its
+    performance log, which the network capture tools read.
+
+    If a cached chromedriver no longer matches the installed browser (typically
+    after a browser update), the driver path is resolved again and the launch retried once.
+    """
+    chrome_options = Options()
+    if headless:
+        chrome_options.add_argument("--headless")
+    chrome_options.add_argument(f"--user-data-dir={profile_path}")
+    chrome_options.binary_location = CHROMIUM_PATH
+    chrome_options.page_load_strategy = page_load_strategy
+    if network_logging:
+        chrome_options.set_capability("goog:loggingPrefs", {"performance": "ALL"})
+        chrome_options.add_experimental_option("perfLoggingPrefs", {"enableNetwork": True, "enablePage": False})
+
+    try:
+        return webdriver.Chrome(service=Service(_resolve_driver_path()), options=chrome_options)
+    except SessionNotCreatedException:
+        if CHROMEDRIVER_PATH:
+            raise
+        return webdriver.Chrome(service=Service(_resolve_driver_path(refresh=True)), options=chrome_options)
+
+
+class WarmPool:
+    """
+    Headless Chrome instances launched ahead of time, so launch_browser can hand one out instantly.
+
+    Each warm browser gets a temporary profile directory, deleted when the
+    browser quits. Taking a browser from the pool starts a background thread
+    that launches replacements until the pool is back at `size`.
+    """
+
+    def __init__(self, size: int):
+        self.size = size
+        self._idle = deque()  # (driver, profile_path)
+        self._lock = threading.Lock()
+        self._filler = None
+        self._closed = False
+        self.launched = 0
+        self.handed_out = 0
+        self.failures = 0
+
+    def take(self):
+        """
+        Returns (driver, profile_path) of a warm browser, or None if the pool is empty.
+        """
+        item = None
+        while True:
+            with self._lock:
+                if not self._idle:
+                    break
+                driver, profile_path = self._idle.popleft()
+            try:
+                driver.current_window_handle  # Cheap liveness check; warm browsers can crash while idle
+            except Exception:
+                _quit_driver(driver, profile_path)
+                continue
+            item = (driver, profile_path)
+            self.handed_out += 1
+            break
+        self.replenish()
+        return item
+
+    def replenish(self) -> None:
+        """
+        Starts the background launcher if the pool is below its size and no launcher is running.
+        """
+        with self._lock:
+            if self.size <= 0 or self._closed or self._filler is not None or len(self._idle) >= self.size:
+                return
+            self._filler = threading.Thread(target=self._fill, name="chrome-warm-pool", daemon=True)
+            self._filler.start()
+
+    def _fill(self) -> None:
+        while True:
+            with self._lock:
+                if self._closed or len(self._idle) >= self.size:
+                    self._filler = None
+                    return
+            profile_path = tempfile.mkdtemp(prefix="mcp_chromedriver_warm_")
+            try:
+                driver = _start_chrome(profile_path, headless=True)
+            except Exception:
+                shutil.rmtree(profile_path, ignore_errors=True)
+                with self._lock:
+                    self.failures += 1
+                    self._filler = None  # Retried on the next take() rather than spinning on a broken install
+                return
+            with self._lock:
+                if not self._closed:
+                    self._idle.append((driver, profile_path))
+                    self.launched += 1
+                    continue
+            _quit_driver(driver, profile_path)
+
+    def close_all(self) -> None:
+        with self._lock:
+            self._closed = True
+            idle = list(self._idle)
+            self._idle.clear()
+        for driver, profile_path in idle:
+            _quit_driver(driver, profile_path)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "size": self.size,
+                "idle": len(self._idle),
+                "launched": self.launched,
+                "handed_out": self.handed_out,
+                "failures": self.failures,
+            }
+
+
+warm_pool = WarmPool(CHROME_WARM_POOL_SIZE)
+warm_pool.replenish()
+atexit.register(warm_pool.close_all)
+
+
+def _blocked_url_patterns(block_resources: Optional[List[str]]) -> List[str]:
+    # Expands preset names into their URL patterns; anything else is taken as a pattern itself.
+    patterns = []
+    for entry in block_resources or []:
+        for pattern in BLOCK_PRESETS.get(entry, [entry]):
+            if pattern not in patterns:
+                patterns.append(pattern)
+    return patterns
+
+
+def _apply_blocking(driver, patterns: List[str]) -> None:
+    """
+    Blocks requests matching `patterns` in the current tab through the DevTools protocol.
+
+    The block list belongs to the tab, so it has to be applied again to every new tab.
+    """
+    if not patterns:
+        return
+    driver.execute_cdp_cmd("Network.enable", {})
+    driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": patterns})
 
 def _find_element(driver, by: str, locator: str):
     """
@@ -53,49 +517,89 @@ def _find_element(driver, by: str, locator: str):
 
 
 @mcp.tool()
-def launch_browser(url: str, headless: bool = False) -> str:
+def launch_browser(url: str, headless: bool = False, session_id: str = DEFAULT_SESSION_ID, use_warm_pool: bool = True,
+                   page_load_strategy: Literal["normal", "eager", "none"] = "normal", block_resources: Optional[List[str]] = None,
+                   capture_network: bool = False) -> str:
     """
     Launches a Chrome browser instance with the given URL.
 
+    Each session has its own browser and profile directory. Launching a session
+    that is already running replaces its browser, and when CHROME_MAX_SESSIONS
+    sessions are open the least recently used one is closed to make room.
+
+    Headless launches are served from the warm pool of pre-launched browsers
+    when CHROME_WARM_POOL_SIZE is set. Warm browsers use a fresh temporary
+    profile, so pass use_warm_pool=False to get the session's own profile
+    directory (with its cookies and logins) instead.
+
+    For text extraction, page_load_strategy="eager" makes navigation return once
+    the DOM is ready instead of waiting for every image and script, and
+    block_resources stops images, fonts, media, analytics and ads from loading
+    at all. Blocking works through the DevTools protocol and is reapplied to
+    tabs opened with open_new_tab or entered with switch_to_tab.
+
     Args:
         url (str): The URL to open in the browser.
         headless (bool, optional): Whether to launch the browser in headless mode. Defaults to False.
+        session_id (str, optional): The name of the browser session to launch. Defaults to "default".
+        use_warm_pool (bool, optional): Whether a headless launch may take a pre-launched browser. Defaults to True.
+            Warm browsers use the normal page load strategy, so other strategies always launch a new browser.
+        page_load_strategy (str, optional): When navigation returns: 'normal' waits for the load event, 'eager' for
+            DOMContentLoaded and 'none' returns right away. Defaults to 'normal'.
+        block_resources (list of str, optional): Presets to block ('images', 'fonts', 'media', 'analytics', 'ads')
+            and/or URL patterns with '*' wildcards, e.g. '*.css'. Defaults to blocking nothing.
+        capture_network (bool, optional): Whether to enable Chrome's performance log so start_network_capture
+            can record the session's network activity. Always launches a new browser. Defaults to False.
 
     Returns:
         str: A success message if the browser is launched successfully, or an error message if the operation fails.
     """
-    global driver  # Use the global driver variable
+    if not _SESSION_ID_PATTERN.match(session_id):
+        return f"Error: Invalid session_id '{session_id}'. Use 1-64 letters, digits, '.', '_' or '-'."
     try:
-        chrome_options = Options()
-        if headless:
-            chrome_options.add_argument("--headless")
-        chrome_options.add_argument(f"--user-data-dir={CHROME_PROFILE_PATH}")
-        chrome_options.binary_location = CHROMIUM_PATH
-
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
+        # Quit a browser already running under this session first, so its profile directory is free again.
+        if sessions.get(session_id) is not None:
+            sessions.close(session_id)
+
+        blocked_urls = _blocked_url_patterns(block_resources)
+        warm_capable = headless and use_warm_pool and page_load_strategy == "normal" and not capture_network
+        warm = warm_pool.take() if warm_capable else None
+        if warm is not None:
+            driver, profile_path = warm
+            evicted = sessions.add(session_id, driver, profile_path, headless, temporary_profile=True,
+                                   blocked_urls=blocked_urls)
+        else:
+            profile_path = _profile_path(session_id)
+            driver = _start_chrome(profile_path, headless, page_load_strategy, capture_network)
+            evicted = sessions.add(session_id, driver, profile_path, headless, page_load_strategy=page_load_strategy,
+                                   blocked_urls=blocked_urls, network_logging=capture_network)
+        _apply_blocking(driver, blocked_urls)
         driver.get(url)
         # Do NOT quit the driver, so the browser stays open
-        return f"Successfully launched browser with URL: {url} in {'headless' if headless else 'GUI'} mode."
+        message = f"Successfully launched browser with URL: {url} in {'headless' if headless else 'GUI'} mode (session '{session_id}'{', warm start' if warm else ''})."
+        if evicted:
+            message += f" Closed least recently used session(s) to stay within {MAX_SESSIONS}: {', '.join(evicted)}."
+        return message
     except WebDriverException as e:
         return f"ChromeDriver error: {str(e)}"
     except Exception as e:
         return f"Failed to launch browser: {str(e)}"
 
 @mcp.tool()
-def goto_page(url: str) -> str:
+def goto_page(url: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Navigates the existing browser instance to the given URL.
 
     Args:
         url (str): The URL to navigate to.
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: A success message if the navigation is successful, or an error message if the operation fails.
     """
-    global driver  # Use the global driver variable
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
     try:
         driver.get(url)
         return f"Successfully navigated to URL: {url}"
@@ -105,40 +609,40 @@ def goto_page(url: str) -> str:
         return f"Failed to navigate to URL: {str(e)}"
 
 @mcp.tool()
-def close_browser() -> str:
+def close_browser(session_id: str = DEFAULT_SESSION_ID) -> str:
     """
-    Closes the current browser instance.
+    Closes the browser instance of a session.
+
+    Args:
+        session_id (str, optional): The browser session to close. Defaults to "default".
 
     Returns:
         str: A success message if the browser is closed successfully, or an error message if the operation fails.
     """
-    global driver
-    if driver:
-        try:
-            driver.quit()
-            driver = None  # Reset the driver to None after closing
-            return "Browser closed successfully."
-        except WebDriverException as e:
-            return f"ChromeDriver error: {str(e)}"
-        except Exception as e:
-            return f"Failed to close browser: {str(e)}"
-    else:
-        return "Error: Browser not launched. No browser to close."
+    try:
+        if sessions.close(session_id):
+            return f"Browser closed successfully (session '{session_id}')."
+        return f"Error: Browser not launched for session '{session_id}'. No browser to close."
+    except WebDriverException as e:
+        return f"ChromeDriver error: {str(e)}"
+    except Exception as e:
+        return f"Failed to close browser: {str(e)}"
 
 @mcp.tool()
-def get_page_source(clean_with_html2text: bool = False) -> str:
+def get_page_source(clean_with_html2text: bool = False, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Retrieves the source code of the current page in the browser.
 
     Args:
         clean_with_html2text (bool, optional): Whether to clean the source code using html2text. Defaults to False.
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: The page source code, or an error message if the operation fails.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
     try:
         source = driver.page_source
         if clean_with_html2text:
@@ -150,19 +654,20 @@ def get_page_source(clean_with_html2text: bool = False) -> str:
         return f"Failed to retrieve page source: {str(e)}"
 
 @mcp.tool()
-def execute_javascript(script: str) -> str:
+def execute_javascript(script: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Executes JavaScript code in the current browser instance.
 
     Args:
         script (str): The JavaScript code to execute.
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: The result of the JavaScript execution, or an error message if the operation fails.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
     try:
         result = driver.execute_script(script)
         return str(result)  # Convert result to string for MCP compatibility
@@ -171,48 +676,207 @@ def execute_javascript(script: str) -> str:
     except Exception as e:
         return f"Failed to execute JavaScript: {str(e)}"
 
+# Reads the scroll position, viewport, device pixel ratio, document size and (if given) an
+# element's box in page coordinates, everything _capture_screenshot needs in one round trip.
+_SCREENSHOT_GEOMETRY_JS = """
+var element = arguments[0];
+var geometry = {
+    scroll_x: window.scrollX, scroll_y: window.scrollY,
+    viewport_width: window.innerWidth, viewport_height: window.innerHeight,
+    document_width: document.documentElement.scrollWidth, document_height: document.documentElement.scrollHeight,
+    device_pixel_ratio: window.devicePixelRatio || 1
+};
+if (element) {
+    var rect = element.getBoundingClientRect();
+    geometry.element = {x: rect.left + window.scrollX, y: rect.top + window.scrollY, width: rect.width, height: rect.height};
+}
+return geometry;
+"""
+
+
+def _capture_screenshot(driver, image_format: str = "png", quality: Optional[int] = None, max_width: Optional[int] = None,
+                        locator: Optional[str] = None, by: str = "css_selector", clip: Optional[Dict[str, float]] = None,
+                        full_page: bool = False) -> bytes:
+    """
+    Captures a screenshot in memory through the DevTools protocol (Page.captureScreenshot).
+
+    The captured region is, in order of precedence, the element found by `locator`
+    and `by`, the `clip` rectangle ({x, y, width, height} in CSS pixels relative
+    to the top of the page), the whole page when `full_page` is set, or the
+    viewport. Images wider than `max_width` pixels are scaled down by Chrome
+    while capturing, so no full-resolution image is ever encoded.
+
+    Returns:
+        The encoded image.
+    """
+    element = _find_element(driver, by, locator) if locator else None
+    geometry = driver.execute_script(_SCREENSHOT_GEOMETRY_JS, element)
+
+    if element is not None:
+        region = geometry["element"]
+    elif clip:
+        region = {key: float(clip[key]) for key in ("x", "y", "width", "height")}
+    elif full_page:
+        region = {"x": 0, "y": 0, "width": geometry["document_width"], "height": geometry["document_height"]}
+    else:
+        region = {"x": geometry["scroll_x"], "y": geometry["scroll_y"],
+                  "width": geometry["viewport_width"], "height": geometry["viewport_height"]}
+    if region["width"] <= 0 or region["height"] <= 0:
+        raise ValueError("The area to capture is empty.")
+
+    scale = 1
+    pixel_width = region["width"] * geometry["device_pixel_ratio"]
+    if max_width and pixel_width > max_width:
+        scale = max_width / pixel_width
+
+    # Regions outside the viewport are only rendered when Chrome is told to capture beyond it.
+    beyond_viewport = (
+        region["x"] < geometry["scroll_x"] or region["y"] < geometry["scroll_y"]
+        or region["x"] + region["width"] > geometry["scroll_x"] + geometry["viewport_width"]
+        or region["y"] + region["height"] > geometry["scroll_y"] + geometry["viewport_height"]
+    )
+    params = {
+        "format": image_format,
+        "clip": dict(region, scale=scale),
+        "captureBeyondViewport": beyond_viewport,
+    }
+    if image_format != "png" and quality is not None:
+        params["quality"] = quality
+    return base64.b64decode(driver.execute_cdp_cmd("Page.captureScreenshot", params)["data"])
+
+
+def _screenshot_options_error(image_format: str, quality: Optional[int], max_width: Optional[int], clip: Optional[Dict[str, float]]) -> Optional[str]:
+    if image_format not in ("png", "jpeg", "webp"):
+        return f"Error: Unsupported image_format '{image_format}'. Supported formats are: png, jpeg, webp"
+    if quality is not None and not 0 <= quality <= 100:
+        return "Error: quality must be between 0 and 100."
+    if max_width is not None and max_width < 1:
+        return "Error: max_width must be at least 1."
+    if clip is not None and any(key not in clip for key in ("x", "y", "width", "height")):
+        return "Error: clip must have x, y, width and height."
+    return None
+
+
 @mcp.tool()
-def take_screenshot(filename: str = "screenshot.png") -> str:
+def take_screenshot(filename: str = "screenshot.png", output: Literal["file", "base64"] = "file",
+                    image_format: Literal["png", "jpeg", "webp"] = "png", quality: Optional[int] = None,
+                    max_width: Optional[int] = None, locator: Optional[str] = None, by: str = "css_selector",
+                    clip: Optional[Dict[str, float]] = None, full_page: bool = False, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
-    Takes a screenshot of the current page and saves it to the downloads directory.
+    Takes a screenshot of the current page and saves it to the downloads directory, or returns it as base64.
+
+    Without any of the capture options, the viewport is saved as a PNG exactly
+    as before. The options capture in memory through the DevTools protocol,
+    which can encode JPEG or WebP, scale the image down and capture a single
+    element, a rectangle or the whole page.
 
     Args:
         filename (str, optional): The filename to use for the screenshot. Defaults to "screenshot.png".
+        output (str, optional): 'file' to save the image to the downloads directory, or 'base64' to return it
+            as a data URL without touching the disk. Defaults to 'file'.
+        image_format (str, optional): 'png', 'jpeg' or 'webp'. Defaults to 'png'.
+        quality (int, optional): The JPEG or WebP quality, from 0 to 100. Defaults to Chrome's default.
+        max_width (int, optional): Scale the image down to at most this many pixels wide. Defaults to no scaling.
+        locator (str, optional): Capture only the element found with this locator.
+        by (str, optional): The method used to locate the element. Defaults to 'css_selector'.
+        clip (dict, optional): Capture only this rectangle: {"x", "y", "width", "height"} in CSS pixels from the top of the page.
+        full_page (bool, optional): Capture the whole page instead of the viewport. Defaults to False.
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
-        str: A success message if the screenshot is saved successfully, or an error message if the operation fails.
+        str: A success message with the file path, the image as a "data:image/...;base64," URL,
+             or an error message if the operation fails.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
+    error = _screenshot_options_error(image_format, quality, max_width, clip)
+    if error:
+        return error
+
     try:
-        # Create the download directory if it doesn't exist
+        in_memory = (output != "file" or image_format != "png" or quality is not None or max_width
+                     or locator or clip or full_page)
+        if not in_memory:
+            # Create the download directory if it doesn't exist
+            if not os.path.exists(DEFAULT_DOWNLOAD_PATH):
+                os.makedirs(DEFAULT_DOWNLOAD_PATH)
+
+            filepath = os.path.join(DEFAULT_DOWNLOAD_PATH, filename)
+            driver.save_screenshot(filepath)
+            return f"Screenshot saved successfully to: {filepath}"
+
+        image = _capture_screenshot(driver, image_format, quality, max_width, locator, by, clip, full_page)
+        if output == "base64":
+            return f"data:image/{image_format};base64,{base64.b64encode(image).decode('ascii')}"
+
         if not os.path.exists(DEFAULT_DOWNLOAD_PATH):
             os.makedirs(DEFAULT_DOWNLOAD_PATH)
-
         filepath = os.path.join(DEFAULT_DOWNLOAD_PATH, filename)
-        driver.save_screenshot(filepath)
+        with open(filepath, "wb") as f:
+            f.write(image)
         return f"Screenshot saved successfully to: {filepath}"
+    except NoSuchElementException:
+        return f"Error: Element with locator '{locator}' not found using method '{by}'."
     except WebDriverException as e:
         return f"ChromeDriver error: {str(e)}"
     except Exception as e:
         return f"Failed to take screenshot: {str(e)}"
 
 @mcp.tool()
-def find_element(locator: str, by: str) -> str:
+def capture_screenshot(image_format: Literal["png", "jpeg", "webp"] = "jpeg", quality: Optional[int] = 80,
+                       max_width: Optional[int] = 1280, locator: Optional[str] = None, by: str = "css_selector",
+                       clip: Optional[Dict[str, float]] = None, full_page: bool = False, session_id: str = DEFAULT_SESSION_ID) -> Image:
+    """
+    Captures a screenshot in memory and returns it as an image, ready for a vision model.
+
+    Nothing is written to disk. The defaults produce a JPEG of the viewport at
+    most 1280 pixels wide.
+
+    Args:
+        image_format (str, optional): 'png', 'jpeg' or 'webp'. Defaults to 'jpeg'.
+        quality (int, optional): The JPEG or WebP quality, from 0 to 100. Defaults to 80.
+        max_width (int, optional): Scale the image down to at most this many pixels wide, or None for full resolution. Defaults to 1280.
+        locator (str, optional): Capture only the element found with this locator.
+        by (str, optional): The method used to locate the element. Defaults to 'css_selector'.
+        clip (dict, optional): Capture only this rectangle: {"x", "y", "width", "height"} in CSS pixels from the top of the page.
+        full_page (bool, optional): Capture the whole page instead of the viewport. Defaults to False.
+        session_id (str, optional): The browser session to use. Defaults to "default".
+
+    Returns:
+        Image: The screenshot. Failures are reported as tool errors.
+    """
+    driver = sessions.get(session_id)
+    if driver is None:
+        raise RuntimeError(_browser_not_launched(session_id))
+    error = _screenshot_options_error(image_format, quality, max_width, clip)
+    if error:
+        raise ValueError(error)
+
+    try:
+        image = _capture_screenshot(driver, image_format, quality, max_width, locator, by, clip, full_page)
+    except NoSuchElementException:
+        raise RuntimeError(f"Error: Element with locator '{locator}' not found using method '{by}'.")
+    except WebDriverException as e:
+        raise RuntimeError(f"ChromeDriver error: {str(e)}")
+    return Image(data=image, format=image_format)
+
+@mcp.tool()
+def find_element(locator: str, by: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Finds an element on the page using the specified locator and 'by' method.
 
     Args:
         locator (str): The locator string (e.g., an ID, class name, XPath).
         by (str): The method to use for locating the element (e.g., 'id', 'xpath', 'class_name', 'tag_name').
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: The text content of the found element, or an error message if the element is not found or the browser is not launched.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         element = _find_element(driver, by, locator)
@@ -230,20 +894,21 @@ def find_element(locator: str, by: str) -> str:
         return f"Failed to find element: {str(e)}"
 
 @mcp.tool()
-def get_element_text(locator: str, by: str) -> str:
+def get_element_text(locator: str, by: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Retrieves the text content of a specific element on a webpage.
 
     Args:
         locator (str): The locator string to identify the element (e.g., an ID, class name, XPath).
         by (str): The method used to locate the element (e.g., 'id', 'xpath', 'class_name', 'tag_name').
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: The text content of the element, or an error message if the element is not found or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         element = _find_element(driver, by, locator)
@@ -261,20 +926,21 @@ def get_element_text(locator: str, by: str) -> str:
         return f"Failed to find element: {str(e)}"
 
 @mcp.tool()
-def click_element(locator: str, by: str) -> str:
+def click_element(locator: str, by: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Clicks a specific element on a webpage.
 
     Args:
         locator (str): The locator string to identify the element (e.g., an ID, class name, XPath).
         by (str): The method used to locate the element (e.g., 'id', 'xpath', 'class_name', 'tag_name').
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: A success message if the element is clicked successfully, or an error message if the element is not found or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         element = _find_element(driver, by, locator)
@@ -289,7 +955,7 @@ def click_element(locator: str, by: str) -> str:
         return f"Failed to click element: {str(e)}"
 
 @mcp.tool()
-def type_into_element(locator: str, by: str, text: str) -> str:
+def type_into_element(locator: str, by: str, text: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Types text into a specific element on a webpage, such as a form field.
 
@@ -297,13 +963,14 @@ def type_into_element(locator: str, by: str, text: str) -> str:
         locator (str): The locator string to identify the element (e.g., an ID, class name, XPath).
         by (str): The method used to locate the element (e.g., 'id', 'xpath', 'class_name', 'tag_name').
         text (str): The text to type into the element.
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: A success message if the text is typed successfully, or an error message if the element is not found or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         element = _find_element(driver, by, locator)
@@ -318,20 +985,21 @@ def type_into_element(locator: str, by: str, text: str) -> str:
         return f"Failed to type into element: {str(e)}"
 
 @mcp.tool()
-def clear_element_text(locator: str, by: str) -> str:
+def clear_element_text(locator: str, by: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Clears the text from a specific element on a webpage, such as a form field.
 
     Args:
         locator (str): The locator string to identify the element (e.g., an ID, class name, XPath).
         by (str): The method used to locate the element (e.g., 'id', 'xpath', 'class_name', 'tag_name').
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: A success message if the text is cleared successfully, or an error message if the element is not found or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         element = _find_element(driver, by, locator)
@@ -346,20 +1014,21 @@ def clear_element_text(locator: str, by: str) -> str:
         return f"Failed to clear text from element: {str(e)}"
 
 @mcp.tool()
-def scroll(delta_x: int = 0, delta_y: int = 0) -> str:
+def scroll(delta_x: int = 0, delta_y: int = 0, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Scrolls the page by a specified amount in the x and y directions.
 
     Args:
         delta_x (int, optional): The amount to scroll in the x direction. Positive values scroll right, negative values scroll left. Defaults to 0.
         delta_y (int, optional): The amount to scroll in the y direction.  Positive values scroll down, negative values scroll up. Defaults to 0.
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: A success message if the page is scrolled successfully, or an error message if the browser is not launched or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         driver.execute_script(f"window.scrollBy({delta_x}, {delta_y});")
@@ -369,87 +1038,82 @@ def scroll(delta_x: int = 0, delta_y: int = 0) -> str:
     except Exception as e:
         return f"Failed to scroll the page: {str(e)}"
 
+# Sections of get_browser_stats. Storage dumps can be large, so they are only included on request.
+_STATS_SECTIONS = ("scroll", "window", "document", "page", "cookies", "local_storage", "session_storage")
+_DEFAULT_STATS_SECTIONS = ("scroll", "window", "document", "page", "cookies")
+
+_BROWSER_STATS_JS = """
+var sections = arguments[0];
+var stats = {};
+function dumpStorage(storage) {
+    var items = {};
+    for (var i = 0, len = storage.length; i < len; i++) {
+        var key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+}
+if (sections.indexOf('scroll') !== -1) {
+    stats.scroll_x = window.pageXOffset;
+    stats.scroll_y = window.pageYOffset;
+}
+if (sections.indexOf('window') !== -1) {
+    stats.window_width = window.innerWidth;
+    stats.window_height = window.innerHeight;
+    stats.device_pixel_ratio = window.devicePixelRatio;
+}
+if (sections.indexOf('document') !== -1) {
+    stats.document_width = document.documentElement.scrollWidth;
+    stats.document_height = document.documentElement.scrollHeight;
+    stats.number_of_frames = document.getElementsByTagName('iframe').length;
+}
+if (sections.indexOf('page') !== -1) {
+    stats.title = document.title;
+    stats.url = window.location.href;
+    stats.user_agent = navigator.userAgent;
+}
+if (sections.indexOf('local_storage') !== -1) {
+    try { stats.local_storage = dumpStorage(window.localStorage); } catch (e) { stats.local_storage = null; }
+}
+if (sections.indexOf('session_storage') !== -1) {
+    try { stats.session_storage = dumpStorage(window.sessionStorage); } catch (e) { stats.session_storage = null; }
+}
+return stats;
+"""
+
+
 @mcp.tool()
-def get_browser_stats() -> str:
+def get_browser_stats(sections: Optional[List[str]] = None, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Retrieves statistics about the current browser state, including scroll position, title, URL, and cookies.
 
+    Everything is read by one script execution, plus one cookie request when
+    cookies are selected.
+
+    Args:
+        sections (list of str, optional): The sections to include: 'scroll' (scroll_x, scroll_y),
+            'window' (window_width, window_height, device_pixel_ratio), 'document' (document_width,
+            document_height, number_of_frames), 'page' (title, url, user_agent), 'cookies',
+            'local_storage' and 'session_storage'. Defaults to everything except the two storage dumps.
+        session_id (str, optional): The browser session to use. Defaults to "default".
+
     Returns:
         str: A JSON-formatted string containing the browser statistics,
              or an error message if the browser is not launched or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
-
-    try:
-        # Execute JavaScript to get scroll position
-        scroll_x = driver.execute_script("return window.pageXOffset;")
-        scroll_y = driver.execute_script("return window.pageYOffset;")
-
-        # Get window size
-        window_width = driver.execute_script("return window.innerWidth;")
-        window_height = driver.execute_script("return window.innerHeight;")
-
-        # Get document size
-        document_width = driver.execute_script("return document.documentElement.scrollWidth;")
-        document_height = driver.execute_script("return document.documentElement.scrollHeight;")
-
-        # Get title and URL
-        title = driver.title
-        current_url = driver.current_url
+        return _browser_not_launched(session_id)
 
-        # Get cookies
-        cookies = driver.get_cookies()
+    sections = list(sections) if sections else list(_DEFAULT_STATS_SECTIONS)
+    unknown = [section for section in sections if section not in _STATS_SECTIONS]
+    if unknown:
+        return f"Error: Unknown section(s): {', '.join(unknown)}. Supported sections are: {', '.join(_STATS_SECTIONS)}"
 
-        # Get local storage
-        local_storage = driver.execute_script("""
-            var items = {};
-            for (var i = 0, len = localStorage.length; i < len; i++) {
-                var key = localStorage.key(i);
-                items[key] = localStorage.getItem(key);
-            }
-            return items;
-        """)
-
-        # Get session storage
-        session_storage = driver.execute_script("""
-            var items = {};
-            for (var i = 0, len = sessionStorage.length; i < len; i++) {
-                var key = sessionStorage.key(i);
-                items[key] = sessionStorage.getItem(key);
-            }
-            return items;
-        """)
-
-       # Get number of frames
-        number_of_frames = len(driver.find_elements(By.TAG_NAME, "iframe"))
-
-        # Get device pixel ratio
-        device_pixel_ratio = driver.execute_script("return window.devicePixelRatio;")
-
-        # Get user agent
-        user_agent = driver.execute_script("return navigator.userAgent;")
-
-        # Create a dictionary to store the stats
-        stats = {
-            "scroll_x": scroll_x,
-            "scroll_y": scroll_y,
-            "window_width": window_width,
-            "window_height": window_height,
-            "document_width": document_width,
-            "document_height": document_height,
-            "title": title,
-            "url": current_url,
-            "cookies": cookies,
-            "local_storage": local_storage,
-            "session_storage": session_storage,
-            "number_of_frames": number_of_frames,
-            "device_pixel_ratio": device_pixel_ratio,
-            "user_agent": user_agent,
-        }
-
-        import json
+    try:
+        stats = driver.execute_script(_BROWSER_STATS_JS, sections) or {}
+        if "cookies" in sections:
+            stats["cookies"] = driver.get_cookies()
         return json.dumps(stats, indent=4, default=str)  # Convert the dictionary to a JSON string
 
     except WebDriverException as e:
@@ -458,7 +1122,7 @@ def get_browser_stats() -> str:
         return f"Failed to retrieve browser stats: {str(e)}"
 
 @mcp.tool()
-def get_element_attribute(locator: str, by: str, attribute: str) -> str:
+def get_element_attribute(locator: str, by: str, attribute: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Retrieves the value of a specific attribute of an element on a webpage.
 
@@ -466,14 +1130,15 @@ def get_element_attribute(locator: str, by: str, attribute: str) -> str:
         locator (str): The locator string to identify the element (e.g., an ID, class name, XPath).
         by (str): The method used to locate the element (e.g., 'id', 'xpath', 'class_name', 'tag_name').
         attribute (str): The name of the attribute to retrieve (e.g., 'href', 'src', 'class').
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: The value of the attribute, or an error message if the element is not found, 
              the attribute is not present, or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         element = _find_element(driver, by, locator)
@@ -491,86 +1156,153 @@ def get_element_attribute(locator: str, by: str, attribute: str) -> str:
     except Exception as e:
         return f"Failed to get element attribute: {str(e)}"
 
+# Element lookup in page JavaScript, mirroring the 'by' methods of _find_element. Prepended to
+# scripts that need to find elements without a WebDriver round trip per element.
+_FIND_ELEMENTS_JS = r"""
+function _mcpFindAll(by, locator) {
+    var quoted = '"' + locator.replace(/(["\\])/g, '\\$1') + '"';
+    switch (by) {
+        case 'id': return Array.from(document.querySelectorAll('[id=' + quoted + ']'));
+        case 'name': return Array.from(document.querySelectorAll('[name=' + quoted + ']'));
+        case 'class_name': return Array.from(document.getElementsByClassName(locator));
+        case 'tag_name': return Array.from(document.getElementsByTagName(locator));
+        case 'css_selector': return Array.from(document.querySelectorAll(locator));
+        case 'xpath':
+            var snapshot = document.evaluate(locator, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            var nodes = [];
+            for (var i = 0; i < snapshot.snapshotLength; i++) {
+                if (snapshot.snapshotItem(i).nodeType === Node.ELEMENT_NODE) nodes.push(snapshot.snapshotItem(i));
+            }
+            return nodes;
+        case 'link_text':
+            return Array.from(document.querySelectorAll('a')).filter(function (a) { return a.innerText.trim() === locator.trim(); });
+        case 'partial_link_text':
+            return Array.from(document.querySelectorAll('a')).filter(function (a) { return a.innerText.indexOf(locator) !== -1; });
+    }
+    throw new Error("Invalid 'by' method: " + by);
+}
+
+function _mcpIsVisible(element) {
+    if (element.checkVisibility) {
+        if (!element.checkVisibility({checkOpacity: true, checkVisibilityCSS: true})) return false;
+    } else {
+        var style = window.getComputedStyle(element);
+        if (style.display === 'none' || style.visibility === 'hidden' || style.opacity === '0') return false;
+    }
+    var rect = element.getBoundingClientRect();
+    return rect.width > 0 && rect.height > 0;
+}
+"""
+
+_BY_METHODS = ("id", "xpath", "class_name", "tag_name", "name", "css_selector", "link_text", "partial_link_text")
+
+_GET_ELEMENTS_JS = _FIND_ELEMENTS_JS + """
+var by = arguments[0], locator = arguments[1], offset = arguments[2], limit = arguments[3];
+var wanted = arguments[4], filter = arguments[5];
+var matches = _mcpFindAll(by, locator);
+if (filter) {
+    matches = matches.filter(function (element) {
+        return Object.keys(filter).every(function (name) {
+            var value = element.getAttribute(name);
+            return value !== null && value.indexOf(filter[name]) !== -1;
+        });
+    });
+}
+var page = limit === null ? matches.slice(offset) : matches.slice(offset, offset + limit);
+return {
+    total: matches.length,
+    elements: page.map(function (element, i) {
+        var attributes = {};
+        if (wanted) {
+            wanted.forEach(function (name) {
+                var value = element.getAttribute(name);
+                if (value !== null) attributes[name] = value;
+            });
+        } else {
+            for (var j = 0; j < element.attributes.length; j++) {
+                attributes[element.attributes[j].name] = element.attributes[j].value;
+            }
+        }
+        var visible = _mcpIsVisible(element);
+        var rect = element.getBoundingClientRect();
+        return {
+            index: offset + i,
+            tag: element.tagName.toLowerCase(),
+            text: visible ? element.innerText.trim() : '',
+            attributes: attributes,
+            rect: {x: Math.round(rect.x), y: Math.round(rect.y), width: Math.round(rect.width), height: Math.round(rect.height)},
+            visible: visible
+        };
+    })
+};
+"""
+
+
 @mcp.tool()
-def get_elements(locator: str, by: str) -> str:
+def get_elements(locator: str, by: str, offset: int = 0, limit: Optional[int] = None, attributes: Optional[List[str]] = None,
+                 attribute_filter: Optional[Dict[str, str]] = None, session_id: str = DEFAULT_SESSION_ID) -> str:
     """
     Retrieves a list of elements matching the given locator and 'by' method.
 
+    All matching elements are found and read in the page by a single script, so
+    the cost does not grow with WebDriver round trips per element. Every match is
+    returned unless a limit is given; large result sets can be paged with offset
+    and limit, continuing at offset + the number of elements returned until it
+    reaches 'total'.
+
+    The result is an object wrapping the element list with the paging
+    information, not a bare list of elements: read the list from 'elements'.
+
     Args:
         locator (str): The locator string (e.g., an ID, class name, XPath).
         by (str): The method to use for locating the element (e.g., 'id', 'xpath', 'class_name', 'tag_name').
+        offset (int, optional): The number of matching elements to skip. Defaults to 0.
+        limit (int, optional): The maximum number of elements to return. Defaults to None (all of them).
+        attributes (list of str, optional): Only return these attributes of each element. Defaults to all attributes.
+        attribute_filter (dict, optional): Only match elements whose attributes contain the given values,
+            e.g. {"href": "/product/"}. An empty value only requires the attribute to be present.
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
-        str: A JSON-formatted string containing a list of dictionaries, where each dictionary
-             represents an element and contains its 'text' and 'attributes'.
+        str: A JSON-formatted object {"total": ..., "offset": ..., "elements": [...]}: the total number
+             of matching elements, the offset the page starts at, and the list of elements, where each
+             element contains its 'index', 'tag', 'text', 'attributes', bounding 'rect' and whether it
+             is 'visible'.
              Returns an error message if the browser is not launched or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
-
-    try:
-        if by == "id":
-            elements = driver.find_elements(By.ID, locator)
-        elif by == "xpath":
-            elements = driver.find_elements(By.XPATH, locator)
-        elif by == "class_name":
-            elements = driver.find_elements(By.CLASS_NAME, locator)
-        elif by == "tag_name":
-            elements = driver.find_elements(By.TAG_NAME, locator)
-        elif by == "name":
-            elements = driver.find_elements(By.NAME, locator)
-        elif by == "css_selector":
-            elements = driver.find_elements(By.CSS_SELECTOR, locator)
-        elif by == "link_text":
-            elements = driver.find_elements(By.LINK_TEXT, locator)
-        elif by == "partial_link_text":
-            elements = driver.find_elements(By.PARTIAL_LINK_TEXT, locator)
-        else:
-            return f"Error: Invalid 'by' method: {by}. Supported methods are: id, xpath, class_name, tag_name, name, css_selector, link_text, partial_link_text"
-
-        element_list = []
-        for element in elements:
-            element_data = {
-                "text": element.text,
-                "attributes": driver.execute_script(
-                    """
-                    var items = {};
-                    var attrs = arguments[0].attributes;
-                    for (var i = 0; i < attrs.length; i++) {
-                        items[attrs[i].name] = attrs[i].value;
-                    }
-                    return items;
-                    """,
-                    element,
-                ),
-            }
-            element_list.append(element_data)
+        return _browser_not_launched(session_id)
 
-        import json
-        return json.dumps(element_list, indent=4, default=str)
+    if by not in _BY_METHODS:
+        return f"Error: Invalid 'by' method: {by}. Supported methods are: {', '.join(_BY_METHODS)}"
+    if offset < 0 or (limit is not None and limit < 0):
+        return "Error: offset and limit must not be negative."
+
+    try:
+        result = driver.execute_script(_GET_ELEMENTS_JS, by, locator, offset, limit, attributes, attribute_filter)
+        return json.dumps({"total": result["total"], "offset": offset, "elements": result["elements"]}, indent=4, default=str)
 
-    except NoSuchElementException:
-        return f"Error: Element with locator '{locator}' not found using method '{by}'."
     except WebDriverException as e:
         return f"ChromeDriver error: {str(e)}"
     except Exception as e:
         return f"Failed to find elements: {str(e)}"
 
 @mcp.tool()
-def submit_form(locator: str, by: str) -> str:
+def submit_form(locator: str, by: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """Submits a form element.
 
     Args:
         locator (str): The locator string to identify the form element (e.g., an ID, class name, XPath).
         by (str): The method used to locate the element (e.g., 'id', 'xpath', 'class_name', 'tag_name').
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: A success message if the form is submitted successfully, or an error message if the form is not found or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         form_element = _find_element(driver, by, locator)
@@ -585,80 +1317,194 @@ def submit_form(locator: str, by: str) -> str:
     except Exception as e:
         return f"Failed to submit form: {str(e)}"
 
+# Wait engine: resolves from inside the page as soon as the condition holds, driven by DOM
+# mutations (plus a slow fallback check for changes that cause no mutation, such as layout),
+# instead of polling over WebDriver.
+_WAIT_CONDITIONS = ("present", "visible", "clickable", "text", "network_idle")
+
+# The internal 'ready_state' condition holds once the document reaches `readyState`, which also gates every
+# other condition when given; documents still on about:blank (a tab about to navigate) never count as ready.
+_WAIT_JS = _FIND_ELEMENTS_JS + """
+var by = arguments[0], locator = arguments[1], condition = arguments[2], text = arguments[3];
+var timeoutMs = arguments[4], idleMs = arguments[5], readyState = arguments[6];
+var done = arguments[arguments.length - 1];
+var states = ['loading', 'interactive', 'complete'];
+var started = Date.now();
+var observer = null, performanceObserver = null, fallback = null, timer = null, finished = false;
+var lastNetworkActivity = Date.now();
+
+function isClickable(element) {
+    if (!_mcpIsVisible(element) || element.disabled || element.getAttribute('aria-disabled') === 'true') return false;
+    return window.getComputedStyle(element).pointerEvents !== 'none';
+}
+
+function hasText(element) {
+    var content = element.innerText || element.textContent || '';
+    return content.indexOf(text) !== -1 || (element.value !== undefined && String(element.value).indexOf(text) !== -1);
+}
+
+function satisfied() {
+    if (readyState && (location.href === 'about:blank' || states.indexOf(document.readyState) < states.indexOf(readyState))) {
+        return false;
+    }
+    if (condition === 'ready_state') return true;
+    if (condition === 'network_idle') {
+        return document.readyState === 'complete' && Date.now() - lastNetworkActivity >= idleMs;
+    }
+    var matches = _mcpFindAll(by, locator);
+    if (condition === 'present') return matches.length > 0;
+    if (condition === 'visible') return matches.some(_mcpIsVisible);
+    if (condition === 'clickable') return matches.some(isClickable);
+    if (condition === 'text') return matches.some(hasText);
+    throw new Error('Unknown wait condition: ' + condition);
+}
+
+function finish(status) {
+    if (finished) return;
+    finished = true;
+    if (observer) observer.disconnect();
+    if (performanceObserver) performanceObserver.disconnect();
+    document.removeEventListener('readystatechange', check);
+    clearInterval(fallback);
+    clearTimeout(timer);
+    done({status: status, elapsed_ms: Date.now() - started});
+}
+
+function check() {
+    if (!finished && satisfied()) finish('ready');
+}
+
+if (satisfied()) {
+    done({status: 'ready', elapsed_ms: 0});
+} else {
+    if (condition === 'network_idle') {
+        // Resource timing entries arrive as requests finish; idle means none for idleMs.
+        performanceObserver = new PerformanceObserver(function () { lastNetworkActivity = Date.now(); });
+        performanceObserver.observe({type: 'resource'});
+        fallback = setInterval(check, Math.max(Math.min(idleMs / 4, 250), 25));
+    } else {
+        observer = new MutationObserver(check);
+        observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+        fallback = setInterval(check, 250);
+    }
+    if (readyState) document.addEventListener('readystatechange', check);
+    timer = setTimeout(function () { finish('timeout'); }, timeoutMs);
+}
+"""
+
+# ChromeDriver errors raised when navigation replaces the document an async script runs in.
+_DOCUMENT_REPLACED_ERRORS = ("document unloaded", "execution context was destroyed", "cannot find context")
+
+
+def _wait_in_page(driver, by: str, locator: str, condition: str, text: Optional[str], timeout: float, idle_ms: int,
+                  ready_state: Optional[str] = None) -> dict:
+    """
+    Runs _WAIT_JS until `condition` holds or `timeout` seconds pass.
+
+    With `ready_state` ('interactive' or 'complete'), the document must also have
+    reached that state; condition 'ready_state' waits for nothing else. If
+    navigation replaces the document while waiting, the wait starts again on the
+    new document. Other WebDriver errors are raised at once.
+
+    Returns:
+        {'status': 'ready' or 'timeout', 'elapsed_ms': ...}.
+    """
+    previous_timeout = driver.timeouts.script
+    driver.set_script_timeout(timeout + 5)
+    started = time.monotonic()
+    try:
+        while True:
+            remaining = timeout - (time.monotonic() - started)
+            if remaining <= 0:
+                return {"status": "timeout", "elapsed_ms": round(timeout * 1000)}
+            try:
+                result = driver.execute_async_script(_WAIT_JS, by, locator, condition, text, int(remaining * 1000), idle_ms,
+                                                     ready_state)
+            except WebDriverException as e:
+                if any(message in str(e).lower() for message in _DOCUMENT_REPLACED_ERRORS):
+                    time.sleep(0.05)
+                    continue
+                raise
+            result["elapsed_ms"] = round((time.monotonic() - started) * 1000)
+            return result
+    finally:
+        driver.set_script_timeout(previous_timeout)
+
+
 @mcp.tool()
-def wait_for_element(by: str, locator: str, timeout: int) -> str:
-    """Waits for an element to be present on the page.
+def wait_for_element(by: str = "css_selector", locator: str = "", timeout: float = 10,
+                     condition: Literal["present", "visible", "clickable", "text", "network_idle"] = "present",
+                     text: Optional[str] = None, idle_ms: int = 500, session_id: str = DEFAULT_SESSION_ID) -> str:
+    """Waits for an element to be present on the page, or for another condition.
+
+    The wait runs inside the page and returns the moment the condition holds, driven by DOM mutations
+    rather than by polling WebDriver.
 
     Args:
-        by (str): The method to use for locating the element (e.g., 'id', 'xpath', 'class_name', 'tag_name').
-        locator (str): The locator string (e.g., an ID, class name, XPath).
-        timeout (int): The maximum time to wait, in seconds.
+        by (str, optional): The method to use for locating the element (e.g., 'id', 'xpath', 'class_name', 'tag_name'). Defaults to 'css_selector'.
+        locator (str): The locator string (e.g., an ID, class name, XPath). Not needed for 'network_idle'.
+        timeout (float, optional): The maximum time to wait, in seconds. Defaults to 10.
+        condition (str, optional): What to wait for: 'present' (in the DOM), 'visible', 'clickable' (visible and
+            enabled), 'text' (contains `text`) or 'network_idle' (page loaded and no request finished for
+            idle_ms). Defaults to 'present'.
+        text (str, optional): The text to wait for with the 'text' condition.
+        idle_ms (int, optional): The quiet period for 'network_idle', in milliseconds. Defaults to 500.
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
-        str: A success message if the element is found within the timeout, or an error message if the timeout is reached or if there's an issue.
+        str: A success message if the condition was met within the timeout, or an error message if the timeout is reached or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
-
-    try:
-        if by == "id":
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.ID, locator))
-            )
-        elif by == "xpath":
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.XPATH, locator))
-            )
-        elif by == "class_name":
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.CLASS_NAME, locator))
-            )
-        elif by == "tag_name":
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.TAG_NAME, locator))
-            )
-        elif by == "name":
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.NAME, locator))
-            )
-        elif by == "css_selector":
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.CSS_SELECTOR, locator))
-            )
-        elif by == "link_text":
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.LINK_TEXT, locator))
-            )
-        elif by == "partial_link_text":
-            element = WebDriverWait(driver, timeout).until(
-                EC.presence_of_element_located((By.PARTIAL_LINK_TEXT, locator))
-            )
-        else:
-            return f"Error: Invalid 'by' method: {by}. Supported methods are: id, xpath, class_name, tag_name, name, css_selector, link_text, partial_link_text"
+        return _browser_not_launched(session_id)
+
+    if condition not in _WAIT_CONDITIONS:
+        return f"Error: Unknown condition '{condition}'. Supported conditions are: {', '.join(_WAIT_CONDITIONS)}"
+    if condition != "network_idle":
+        if by not in _BY_METHODS:
+            return f"Error: Invalid 'by' method: {by}. Supported methods are: {', '.join(_BY_METHODS)}"
+        if not locator:
+            return f"Error: A locator is required for the '{condition}' condition."
+    if condition == "text" and text is None:
+        return "Error: The 'text' condition needs the text to wait for."
 
-        return f"Successfully waited for element with locator '{locator}' using method '{by}' to be present within {timeout} seconds."
+    try:
+        result = _wait_in_page(driver, by, locator, condition, text, timeout, idle_ms)
+        if condition == "network_idle":
+            if result["status"] == "ready":
+                return f"Successfully waited for the network to be idle within {timeout} seconds (after {result['elapsed_ms']} ms)."
+            return f"Timeout: The network did not become idle within {timeout} seconds."
+
+        if result["status"] == "ready":
+            expectation = {"present": "be present", "visible": "be visible", "clickable": "be clickable",
+                           "text": f"contain the text '{text}'"}[condition]
+            return (f"Successfully waited for element with locator '{locator}' using method '{by}' to {expectation} "
+                    f"within {timeout} seconds (after {result['elapsed_ms']} ms).")
+        failure = {"present": "appear", "visible": "become visible", "clickable": "become clickable",
+                   "text": f"contain the text '{text}'"}[condition]
+        return f"Timeout: Element with locator '{locator}' did not {failure} within {timeout} seconds."
 
     except WebDriverException as e:
         return f"ChromeDriver error: {str(e)}"
     except Exception as e:
-        return f"Timeout: Element with locator '{locator}' did not appear within {timeout} seconds."
+        return f"Failed to wait for element: {str(e)}"
 
 @mcp.tool()
-def select_option(locator: str, by: str, value: str) -> str:
+def select_option(locator: str, by: str, value: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """Selects an option from a dropdown menu.
 
     Args:
         locator (str): The locator string to identify the select element (e.g., an ID, class name, XPath).
         by (str): The method used to locate the element (e.g., 'id', 'xpath', 'class_name', 'tag_name').
         value (str): The value of the option to select.
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: A success message if the option is selected successfully, or an error message if the select element or option is not found, or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         select_element = _find_element(driver, by, locator)
@@ -675,20 +1521,21 @@ def select_option(locator: str, by: str, value: str) -> str:
         return f"Failed to select option: {str(e)}"
 
 @mcp.tool()
-def upload_file(locator: str, by: str, file_path: str) -> str:
+def upload_file(locator: str, by: str, file_path: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """Uploads a file to the specified file input element.
 
     Args:
         locator (str): The locator string to identify the file input element (e.g., an ID, class name, XPath).
         by (str): The method used to locate the element (e.g., 'id', 'xpath', 'class_name', 'tag_name').
         file_path (str): The path to the file to upload.
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: A success message if the file is uploaded successfully, or an error message if the element is not found or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         file_input = _find_element(driver, by, locator)
@@ -704,25 +1551,34 @@ def upload_file(locator: str, by: str, file_path: str) -> str:
         return f"Failed to upload file: {str(e)}"
 
 @mcp.tool()
-def open_new_tab(url: str) -> str:
+def open_new_tab(url: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """Opens a new tab with the given URL.
 
     Args:
         url (str): The URL to open in the new tab.
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: A success message if the tab is opened successfully, or an error message if the browser is not launched or if there's an issue.
     """
-    global driver
-    if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+    session = sessions.get_session(session_id)
+    if session is None:
+        return _browser_not_launched(session_id)
+    driver = session.driver
 
     try:
-        # Open a new tab
-        driver.execute_script("window.open('{}', '_blank');".format(url))
+        if session.blocked_urls:
+            # Open the tab blank so the block list is in place before the page starts loading
+            driver.execute_script("window.open('about:blank', '_blank');")
+            driver.switch_to.window(driver.window_handles[-1])
+            _apply_blocking(driver, session.blocked_urls)
+            driver.get(url)
+        else:
+            # Open a new tab
+            driver.execute_script("window.open('{}', '_blank');".format(url))
 
-        # Switch to the new tab
-        driver.switch_to.window(driver.window_handles[-1])
+            # Switch to the new tab
+            driver.switch_to.window(driver.window_handles[-1])
 
         return f"Successfully opened a new tab with URL: {url}"
 
@@ -732,23 +1588,26 @@ def open_new_tab(url: str) -> str:
         return f"Failed to open a new tab: {str(e)}"
 
 @mcp.tool()
-def switch_to_tab(index: int) -> str:
+def switch_to_tab(index: int, session_id: str = DEFAULT_SESSION_ID) -> str:
     """Switches to a specific tab in the browser.
 
     Args:
         index (int): The index of the tab to switch to (0-based).
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: A success message if the tab is switched to successfully, or an error message if the browser is not launched, the index is out of bounds, or if there's an issue.
     """
-    global driver
-    if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+    session = sessions.get_session(session_id)
+    if session is None:
+        return _browser_not_launched(session_id)
+    driver = session.driver
 
     try:
         window_handles = driver.window_handles
         if 0 <= index < len(window_handles):
             driver.switch_to.window(window_handles[index])
+            _apply_blocking(driver, session.blocked_urls)  # The tab may have been opened by the page itself
             return f"Successfully switched to tab with index: {index}"
         else:
             return f"Error: Tab index {index} is out of bounds. There are {len(window_handles)} tabs open (0-{len(window_handles)-1})."
@@ -760,15 +1619,18 @@ def switch_to_tab(index: int) -> str:
 
 
 @mcp.tool()
-def close_tab() -> str:
+def close_tab(session_id: str = DEFAULT_SESSION_ID) -> str:
     """Closes the current tab.
 
+    Args:
+        session_id (str, optional): The browser session to use. Defaults to "default".
+
     Returns:
         str: A success message if the tab is closed successfully, or an error message if the browser is not launched or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         driver.close()
@@ -781,19 +1643,20 @@ def close_tab() -> str:
         return f"Failed to close current tab: {str(e)}"
 
 @mcp.tool()
-def switch_to_frame(by: str, locator: str) -> str:
+def switch_to_frame(by: str, locator: str, session_id: str = DEFAULT_SESSION_ID) -> str:
     """Switches the driver's focus to a particular iframe.
 
     Args:
         by (str): The method to use for locating the iframe (e.g., 'id', 'xpath', 'class_name', 'tag_name').
         locator (str): The locator string (e.g., an ID, class name, XPath).
+        session_id (str, optional): The browser session to use. Defaults to "default".
 
     Returns:
         str: A success message if the switch is successful, or an error message if the iframe is not found or if there's an issue.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         iframe = _find_element(driver, by, locator)
@@ -809,15 +1672,18 @@ def switch_to_frame(by: str, locator: str) -> str:
         return f"Failed to switch to iframe: {str(e)}"
 
 @mcp.tool()
-def get_current_tab_index() -> str:
+def get_current_tab_index(session_id: str = DEFAULT_SESSION_ID) -> str:
     """Returns the index of the currently active tab.
 
+    Args:
+        session_id (str, optional): The browser session to use. Defaults to "default".
+
     Returns:
         str: The index of the current tab (0-based), or an error message if the browser is not launched.
     """
-    global driver
+    driver = sessions.get(session_id)
     if driver is None:
-        return "Error: Browser not launched. Please launch the browser first using the launch_browser tool."
+        return _browser_not_launched(session_id)
 
     try:
         window_handle = driver.current_window_handle
@@ -830,3 +1696,848 @@ def get_current_tab_index() -> str:
         return f"ChromeDriver error: {str(e)}"
     except Exception as e:
         return f"Failed to get current tab index: {str(e)}"
+
+@mcp.tool()
+def list_sessions() -> str:
+    """Lists the open browser sessions.
+
+    Returns:
+        str: A JSON-formatted string with the session limit, the idle timeout, warm pool counters and, for each open session,
+             its id, headless flag, profile directory, age and idle time in seconds (least recently used first).
+    """
+    try:
+        sessions.reap_idle()
+        return json.dumps({
+            "max_sessions": sessions.max_sessions,
+            "idle_timeout": sessions.idle_timeout,
+            "warm_pool": warm_pool.stats(),
+            "sessions": sessions.describe(),
+        }, indent=4)
+    except Exception as e:
+        return f"Failed to list sessions: {str(e)}"
+
+# Tool results that start with one of these are failures.
+_ERROR_PREFIXES = ("Error", "ChromeDriver error", "Failed", "Timeout")
+
+_ACTIONS = ("goto", "click", "type", "clear", "select", "wait_for", "scroll", "extract_text", "screenshot")
+
+
+def _run_step(step: dict, timeout: float, session_id: str) -> str:
+    """
+    Runs one run_actions step through the matching tool and returns the tool's result.
+
+    Element steps first wait up to `timeout` seconds for the element to appear;
+    goto steps use `timeout` as the page load timeout.
+    """
+    action = step["action"]
+    by = step.get("by", "css_selector")
+    if action == "goto":
+        driver = sessions.get(session_id)
+        if driver is None:
+            return _browser_not_launched(session_id)
+        previous_timeout = driver.timeouts.page_load
+        driver.set_page_load_timeout(timeout)
+        try:
+            return goto_page(step["url"], session_id=session_id)
+        finally:
+            driver.set_page_load_timeout(previous_timeout)
+    if action == "scroll":
+        return scroll(step.get("delta_x", 0), step.get("delta_y", 0), session_id=session_id)
+    if action == "screenshot":
+        return take_screenshot(step.get("filename", "screenshot.png"), session_id=session_id)
+    if action == "wait_for":
+        return wait_for_element(by, step.get("locator", ""), timeout, condition=step.get("condition", "present"),
+                                text=step.get("text"), session_id=session_id)
+    if action == "extract_text" and "locator" not in step:
+        return get_page_source(clean_with_html2text=True, session_id=session_id)
+
+    locator = step["locator"]
+    condition = {"click": "clickable", "type": "visible", "clear": "visible", "select": "visible"}.get(action, "present")
+    waited = wait_for_element(by, locator, timeout, condition=condition, session_id=session_id)
+    if waited.startswith(_ERROR_PREFIXES):
+        return waited
+    if action == "click":
+        return click_element(locator, by, session_id=session_id)
+    if action == "type":
+        return type_into_element(locator, by, step["text"], session_id=session_id)
+    if action == "clear":
+        return clear_element_text(locator, by, session_id=session_id)
+    if action == "select":
+        return select_option(locator, by, step["value"], session_id=session_id)
+    return get_element_text(locator, by, session_id=session_id)  # extract_text
+
+
+@mcp.tool()
+def run_actions(steps: List[Dict], stop_on_error: bool = True, default_timeout: float = 10, session_id: str = DEFAULT_SESSION_ID) -> str:
+    """Runs a list of browser actions in order, in a single call.
+
+    Each step is a dictionary with an 'action' and its parameters:
+        - goto: 'url'
+        - click, clear: 'locator', 'by'
+        - type: 'locator', 'by', 'text'
+        - select: 'locator', 'by', 'value'
+        - wait_for: 'locator', 'by', and optionally 'condition' and 'text' as in wait_for_element
+        - scroll: 'delta_x', 'delta_y'
+        - extract_text: 'locator', 'by' for the text of one element, or no locator for the whole page as markdown
+        - screenshot: 'filename'
+    'by' defaults to 'css_selector'. Any step may set 'timeout' in seconds; element steps wait that
+    long for their element (to be clickable for click, visible for type, clear and select, present
+    otherwise), and goto uses it as the page load timeout.
+
+    Args:
+        steps (list of dict): The steps to run.
+        stop_on_error (bool, optional): Whether to stop at the first failed step. Defaults to True.
+        default_timeout (float, optional): The timeout of steps that do not set one, in seconds. Defaults to 10.
+        session_id (str, optional): The browser session to use. Defaults to "default".
+
+    Returns:
+        str: A JSON-formatted string with the number of steps run ('completed'), whether any failed
+             ('failed'), the total time in milliseconds and, for each step run, its index, action,
+             whether it succeeded ('ok'), the tool result and its duration in milliseconds.
+    """
+    if sessions.get(session_id) is None:
+        return _browser_not_launched(session_id)
+
+    results = []
+    failed = False
+    started = time.perf_counter()
+    for index, step in enumerate(steps):
+        step_started = time.perf_counter()
+        action = step.get("action") if isinstance(step, dict) else None
+        if action not in _ACTIONS:
+            result = f"Error: Unknown action '{action}'. Supported actions are: {', '.join(_ACTIONS)}"
+        else:
+            try:
+                result = _run_step(step, step.get("timeout", default_timeout), session_id)
+            except KeyError as e:
+                result = f"Error: Step {index} ({action}) is missing the {e} parameter."
+            except WebDriverException as e:
+                result = f"ChromeDriver error: {str(e)}"
+            except Exception as e:
+                result = f"Failed to run step {index} ({action}): {str(e)}"
+        ok = not result.startswith(_ERROR_PREFIXES)
+        results.append({
+            "index": index,
+            "action": action,
+            "ok": ok,
+            "result": result,
+            "ms": round((time.perf_counter() - step_started) * 1000, 1),
+        })
+        if not ok:
+            failed = True
+            if stop_on_error:
+                break
+
+    return json.dumps({
+        "completed": len(results),
+        "failed": failed,
+        "total_ms": round((time.perf_counter() - started) * 1000, 1),
+        "steps": results,
+    }, indent=4)
+
+
+_PAGE_EXTRACT_JS = """
+var selectors = arguments[0];
+var page = {title: document.title, url: location.href};
+if (selectors) {
+    page.elements = {};
+    selectors.forEach(function (selector) {
+        page.elements[selector] = Array.from(document.querySelectorAll(selector)).map(function (element) {
+            return element.innerText.trim();
+        });
+    });
+}
+return page;
+"""
+
+
+class _CrawlPageError(Exception):
+    """Carries the error message a tool returned for a page, so it is reported as that page's error."""
+
+
+def _crawl_session(session_id: str, work: queue.Queue, results: list, max_tabs: int, ready_state: str,
+                   wait_for: Optional[str], wait_timeout: float, selectors: Optional[List[str]],
+                   max_chars_per_page: Optional[int]) -> None:
+    """
+    Crawls URLs from `work` in one session, keeping up to `max_tabs` pages loading at once.
+
+    New tabs are opened with open_new_tab while the oldest tab is waited on and
+    extracted, so the pages load in parallel while WebDriver commands, which a
+    session can only run one at a time, stay sequential.
+    """
+    driver = sessions.get(session_id)
+    condition = "present" if wait_for else "ready_state"
+    tabs = deque()  # (handle, index, url, started)
+    while True:
+        while len(tabs) < max_tabs:
+            try:
+                index, url = work.get_nowait()
+            except queue.Empty:
+                break
+            started = time.perf_counter()
+            opened = open_new_tab(url, session_id=session_id)
+            if opened.startswith(_ERROR_PREFIXES):
+                results[index] = {"url": url, "ok": False, "error": opened, "ms": round((time.perf_counter() - started) * 1000, 1)}
+                continue
+            tabs.append((driver.current_window_handle, index, url, started))
+        if not tabs:
+            return
+
+        handle, index, url, started = tabs.popleft()
+        try:
+            driver.switch_to.window(handle)
+            status = _wait_in_page(driver, "css_selector", wait_for, condition, None, wait_timeout, 0, ready_state)["status"]
+            page = driver.execute_script(_PAGE_EXTRACT_JS, selectors)
+            result = {"url": url, "ok": True, "final_url": page.get("url"), "title": page.get("title"), "timed_out": status != "ready"}
+            if selectors:
+                result["elements"] = page.get("elements")
+            else:
+                content = get_page_source(clean_with_html2text=True, session_id=session_id)
+                if content.startswith(_ERROR_PREFIXES):
+                    raise _CrawlPageError(content)
+                if max_chars_per_page is not None and len(content) > max_chars_per_page:
+                    content = content[:max_chars_per_page]
+                    result["truncated"] = True
+                result["content"] = content
+        except _CrawlPageError as e:
+            result = {"url": url, "ok": False, "error": str(e)}
+        except WebDriverException as e:
+            result = {"url": url, "ok": False, "error": f"ChromeDriver error: {str(e)}"}
+        except Exception as e:
+            result = {"url": url, "ok": False, "error": f"Failed to crawl page: {str(e)}"}
+        result["ms"] = round((time.perf_counter() - started) * 1000, 1)
+        results[index] = result
+        close_tab(session_id=session_id)
+
+
+def _launch_crawl_session(session_id: str, blocked_urls: List[str]) -> None:
+    """
+    Launches a headless crawl session into a slot reserved with sessions.reserve().
+    """
+    # Crawl sessions are throwaway: a temporary profile is removed again when the session is closed.
+    profile_path = tempfile.mkdtemp(prefix="mcp_chromedriver_crawl_")
+    try:
+        # Page load strategy "none" makes navigation return at once, so tabs load concurrently.
+        driver = _start_chrome(profile_path, True, "none")
+    except Exception:
+        shutil.rmtree(profile_path, ignore_errors=True)
+        raise
+    sessions.add(session_id, driver, profile_path, True, temporary_profile=True, page_load_strategy="none",
+                 blocked_urls=blocked_urls, reserved=True)
+    _apply_blocking(driver, blocked_urls)
+
+
+@mcp.tool()
+async def crawl_urls(urls: List[str], max_tabs: int = 4, max_sessions: int = 1, ready_state: Literal["interactive", "complete"] = "interactive",
+                     wait_for: Optional[str] = None, wait_timeout: float = 15, selectors: Optional[List[str]] = None,
+                     max_chars_per_page: Optional[int] = 20000, block_resources: Optional[List[str]] = None) -> str:
+    """Renders a list of URLs in parallel headless tabs and returns their text or selected elements.
+
+    The crawl launches its own headless browser sessions, which are closed when it finishes. Each session
+    keeps up to max_tabs pages loading at once, and the sessions work through the URLs concurrently.
+    The crawl runs in a worker thread, so other tool calls and sessions are served while it is in progress.
+    Crawl sessions use temporary profiles that are deleted when they close. They count towards
+    CHROME_MAX_SESSIONS and only take free slots: fewer are launched when the limit is close, other
+    sessions are never closed to make room, and the crawl fails if no slot is free.
+
+    Args:
+        urls (list of str): The URLs to render.
+        max_tabs (int, optional): The number of pages each session loads at the same time. Defaults to 4.
+        max_sessions (int, optional): The number of headless browsers to crawl with. Defaults to 1.
+        ready_state (str, optional): The document state a page must reach before it is read: 'interactive'
+            (DOM parsed) or 'complete' (all resources loaded). Defaults to 'interactive'.
+        wait_for (str, optional): A CSS selector that must also match before the page is read, for pages
+            that render their content with JavaScript.
+        wait_timeout (float, optional): The maximum time in seconds to wait for each page. Pages that time
+            out are still read, and flagged with 'timed_out'. Defaults to 15.
+        selectors (list of str, optional): CSS selectors whose matches' text is returned instead of the
+            whole page as markdown.
+        max_chars_per_page (int, optional): The maximum length of each page's markdown. Defaults to 20000.
+        block_resources (list of str, optional): Presets or URL patterns to block, as in launch_browser.
+            Defaults to ["images", "fonts", "media"].
+
+    Returns:
+        str: A JSON-formatted string with one result per URL, in input order ('url', 'ok', 'final_url',
+             'title', 'timed_out' and 'content' or 'elements', or 'error', plus 'ms'), and a summary with
+             the page counts, elapsed seconds and pages per minute.
+    """
+    return await asyncio.to_thread(_crawl_urls, urls, max_tabs, max_sessions, ready_state, wait_for, wait_timeout,
+                                   selectors, max_chars_per_page, block_resources)
+
+
+def _crawl_urls(urls: List[str], max_tabs: int, max_sessions: int, ready_state: str, wait_for: Optional[str],
+                wait_timeout: float, selectors: Optional[List[str]], max_chars_per_page: Optional[int],
+                block_resources: Optional[List[str]]) -> str:
+    # The blocking body of crawl_urls.
+    if not urls:
+        return "Error: No URLs given."
+    if max_tabs < 1 or max_sessions < 1:
+        return "Error: max_tabs and max_sessions must be at least 1."
+    if block_resources is None:
+        block_resources = ["images", "fonts", "media"]
+
+    blocked_urls = _blocked_url_patterns(block_resources)
+    session_count = sessions.reserve(min(max_sessions, len(urls)))
+    if session_count == 0:
+        return (f"Error: All {MAX_SESSIONS} browser session slots (CHROME_MAX_SESSIONS) are in use. "
+                "Close a session with close_browser before crawling; the crawl never closes other sessions.")
+    crawl_id = uuid.uuid4().hex[:8]
+    session_ids = [f"crawl-{crawl_id}-{i}" for i in range(session_count)]
+
+    started = time.perf_counter()
+    work = queue.Queue()
+    for index, url in enumerate(urls):
+        work.put((index, url))
+    results = [None] * len(urls)
+    launched = []
+    try:
+        for session_id in session_ids:
+            try:
+                _launch_crawl_session(session_id, blocked_urls)
+            except Exception as e:
+                if not launched:
+                    prefix = "ChromeDriver error" if isinstance(e, WebDriverException) else "Failed to launch browser"
+                    return f"{prefix}: {str(e)}"
+                break
+            launched.append(session_id)
+
+        with ThreadPoolExecutor(max_workers=len(launched)) as executor:
+            futures = [
+                executor.submit(_crawl_session, session_id, work, results, max_tabs, ready_state, wait_for,
+                                wait_timeout, selectors, max_chars_per_page)
+                for session_id in launched
+            ]
+            for future in futures:
+                future.result()
+    except WebDriverException as e:
+        return f"ChromeDriver error: {str(e)}"
+    except Exception as e:
+        return f"Failed to crawl URLs: {str(e)}"
+    finally:
+        sessions.release(session_count - len(launched))
+        for session_id in session_ids:
+            if sessions.get(session_id) is not None:
+                close_browser(session_id)
+
+    for index, url in enumerate(urls):
+        if results[index] is None:
+            results[index] = {"url": url, "ok": False, "error": "Error: Page was not crawled."}
+    elapsed = time.perf_counter() - started
+    succeeded = sum(1 for result in results if result["ok"])
+    return json.dumps({
+        "summary": {
+            "pages": len(urls),
+            "succeeded": succeeded,
+            "failed": len(urls) - succeeded,
+            "sessions": len(launched),
+            "tabs_per_session": max_tabs,
+            "elapsed_seconds": round(elapsed, 2),
+            "pages_per_minute": round(len(urls) / elapsed * 60, 1) if elapsed else None,
+        },
+        "results": results,
+    }, indent=4)
+
+
+# Network capture: Network.* events are read from Chrome's performance log and turned into a HAR.
+_NETWORK_EVENTS = ("Network.requestWillBeSent", "Network.responseReceived", "Network.dataReceived",
+                   "Network.loadingFinished", "Network.loadingFailed", "Network.requestServedFromCache")
+
+
+def _read_network_events(driver) -> List[dict]:
+    """
+    Drains the performance log and returns the Network.* events in it, as {'method', 'params'} dictionaries.
+    """
+    events = []
+    for entry in driver.get_log("performance"):
+        message = json.loads(entry["message"])["message"]
+        if message.get("method") in _NETWORK_EVENTS:
+            events.append(message)
+    return events
+
+
+def _har_headers(headers: Optional[dict]) -> List[dict]:
+    return [{"name": name, "value": str(value)} for name, value in (headers or {}).items()]
+
+
+def _header_value(headers: Optional[dict], name: str) -> str:
+    # CDP keeps the header case of HTTP/1.1 responses ('Location') and lowercases HTTP/2 ones ('location').
+    for header, value in (headers or {}).items():
+        if header.lower() == name:
+            return str(value)
+    return ""
+
+
+def _har_timings(request: dict) -> dict:
+    # Follows the DevTools HAR exporter: offsets in response.timing are milliseconds after timing.requestTime.
+    response = request.get("response") or {}
+    timing = response.get("timing")
+    end = request.get("end_time", request["start_time"])
+    total = max((end - request["start_time"]) * 1000, 0)
+    if not timing:
+        return {"blocked": 0, "dns": -1, "connect": -1, "ssl": -1, "send": 0, "wait": round(total, 3), "receive": 0}
+
+    def span(start_key: str, end_key: str) -> float:
+        start, finish = timing.get(start_key, -1), timing.get(end_key, -1)
+        return round(finish - start, 3) if start >= 0 and finish >= 0 else -1
+
+    queued = max((timing["requestTime"] - request["start_time"]) * 1000, 0)
+    first_activity = next((timing[key] for key in ("dnsStart", "connectStart", "sendStart") if timing.get(key, -1) >= 0), 0)
+    receive_headers_end = timing.get("receiveHeadersEnd", 0)
+    send_end = timing.get("sendEnd", 0)
+    receive = (end - timing["requestTime"]) * 1000 - receive_headers_end
+    return {
+        "blocked": round(queued + first_activity, 3),
+        "dns": span("dnsStart", "dnsEnd"),
+        "connect": span("connectStart", "connectEnd"),
+        "ssl": span("sslStart", "sslEnd"),
+        "send": max(span("sendStart", "sendEnd"), 0),
+        "wait": round(max(receive_headers_end - send_end, 0), 3),
+        "receive": round(max(receive, 0), 3),
+    }
+
+
+def _build_har(events: List[dict]) -> dict:
+    """
+    Builds a HAR 1.2 log from Network.* DevTools events.
+
+    Redirects become separate entries, like in the DevTools network panel.
+    Each entry also carries the non-standard fields _resourceType, _initiator,
+    _transferSize and, for failed requests, _error.
+    """
+    requests = {}  # requestId -> the request being assembled
+    finished = []
+    for event in events:
+        method, params = event["method"], event["params"]
+        request_id = params.get("requestId")
+        if method == "Network.requestWillBeSent":
+            previous = requests.pop(request_id, None)
+            if previous is not None and params.get("redirectResponse"):
+                previous["response"] = params["redirectResponse"]
+                previous["end_time"] = params["timestamp"]
+                previous["transfer_size"] = params["redirectResponse"].get("encodedDataLength", 0)
+                finished.append(previous)
+            requests[request_id] = {
+                "request": params["request"],
+                "start_time": params["timestamp"],
+                "wall_time": params.get("wallTime", time.time()),
+                "initiator": params.get("initiator", {}),
+                "type": params.get("type", "Other"),
+                "response": None,
+                "size": 0,
+                "transfer_size": 0,
+                "from_cache": False,
+            }
+            continue
+        request = requests.get(request_id)
+        if request is None:
+            continue
+        if method == "Network.responseReceived":
+            request["response"] = params["response"]
+            request["type"] = params.get("type", request["type"])
+        elif method == "Network.dataReceived":
+            request["size"] += params.get("dataLength", 0)
+        elif method == "Network.requestServedFromCache":
+            request["from_cache"] = True
+        elif method == "Network.loadingFinished":
+            request["end_time"] = params["timestamp"]
+            request["transfer_size"] = params.get("encodedDataLength", 0)
+            finished.append(requests.pop(request_id))
+        elif method == "Network.loadingFailed":
+            request["end_time"] = params["timestamp"]
+            request["error"] = params.get("errorText") or "failed"
+            if params.get("blockedReason"):
+                request["error"] += f" ({params['blockedReason']})"
+            finished.append(requests.pop(request_id))
+    finished.extend(requests.values())  # Still in flight when the capture stopped
+
+    entries = []
+    for request in sorted(finished, key=lambda item: item["start_time"]):
+        sent, response = request["request"], request["response"] or {}
+        timings = _har_timings(request)
+        protocol = response.get("protocol", "")
+        entry = {
+            "startedDateTime": datetime.fromtimestamp(request["wall_time"], timezone.utc).isoformat().replace("+00:00", "Z"),
+            "time": round(sum(value for key, value in timings.items() if key != "ssl" and value > 0), 3),
+            "request": {
+                "method": sent.get("method", "GET"),
+                "url": sent["url"],
+                "httpVersion": protocol.upper() if protocol else "HTTP/1.1",
+                "headers": _har_headers(sent.get("headers")),
+                "queryString": [{"name": name, "value": value} for name, value in parse_qsl(urlparse(sent["url"]).query)],
+                "cookies": [],
+                "headersSize": -1,
+                "bodySize": len(sent.get("postData", "")),
+            },
+            "response": {
+                "status": response.get("status", 0),
+                "statusText": response.get("statusText", ""),
+                "httpVersion": protocol.upper() if protocol else "",
+                "headers": _har_headers(response.get("headers")),
+                "cookies": [],
+                "content": {"size": request["size"], "mimeType": response.get("mimeType", "")},
+                "redirectURL": _header_value(response.get("headers"), "location"),
+                "headersSize": -1,
+                "bodySize": request["transfer_size"],
+            },
+            "cache": {},
+            "timings": timings,
+            "serverIPAddress": response.get("remoteIPAddress", ""),
+            "_resourceType": request["type"],
+            "_initiator": request["initiator"],
+            "_transferSize": request["transfer_size"],
+        }
+        if request["from_cache"] or response.get("fromDiskCache"):
+            entry["_fromCache"] = True
+        if "error" in request:
+            entry["_error"] = request["error"]
+        elif "end_time" not in request:
+            entry["_error"] = "unfinished"
+        entries.append(entry)
+
+    return {
+        "log": {
+            "version": "1.2",
+            "creator": {"name": "mcp_chromedriver", "version": "0.1.0"},
+            "pages": [],
+            "entries": entries,
+        }
+    }
+
+
+def _summarize_har(har: dict, top: int) -> dict:
+    """
+    Summarizes a HAR: totals, the slowest and largest requests, and bytes per resource type and host.
+    """
+    entries = har["log"]["entries"]
+    by_type = defaultdict(lambda: {"requests": 0, "transfer_bytes": 0})
+    by_host = defaultdict(lambda: {"requests": 0, "transfer_bytes": 0, "time_ms": 0})
+    for entry in entries:
+        resource_type = by_type[entry["_resourceType"]]
+        resource_type["requests"] += 1
+        resource_type["transfer_bytes"] += entry["_transferSize"]
+        host = by_host[urlparse(entry["request"]["url"]).netloc or entry["request"]["url"][:40]]
+        host["requests"] += 1
+        host["transfer_bytes"] += entry["_transferSize"]
+        host["time_ms"] = round(host["time_ms"] + entry["time"], 1)
+
+    def brief(entry: dict) -> dict:
+        return {
+            "url": entry["request"]["url"],
+            "type": entry["_resourceType"],
+            "status": entry["response"]["status"],
+            "time_ms": entry["time"],
+            "wait_ms": entry["timings"]["wait"],
+            "transfer_bytes": entry["_transferSize"],
+            "size_bytes": entry["response"]["content"]["size"],
+        }
+
+    starts = [datetime.fromisoformat(entry["startedDateTime"].replace("Z", "+00:00")).timestamp() * 1000 for entry in entries]
+    span = max((start + entry["time"] for start, entry in zip(starts, entries)), default=0) - min(starts, default=0)
+    return {
+        "requests": len(entries),
+        "failed": [{"url": entry["request"]["url"], "error": entry["_error"]} for entry in entries if "_error" in entry][:top],
+        "transfer_bytes": sum(entry["_transferSize"] for entry in entries),
+        "content_bytes": sum(entry["response"]["content"]["size"] for entry in entries),
+        "duration_ms": round(span, 1),
+        "slowest": [brief(entry) for entry in sorted(entries, key=lambda item: item["time"], reverse=True)[:top]],
+        "largest": [brief(entry) for entry in sorted(entries, key=lambda item: item["_transferSize"], reverse=True)[:top]],
+        "by_type": dict(sorted(by_type.items(), key=lambda item: item[1]["transfer_bytes"], reverse=True)),
+        "by_host": dict(sorted(by_host.items(), key=lambda item: item[1]["transfer_bytes"], reverse=True)[:top]),
+    }
+
+
+@mcp.tool()
+def start_network_capture(session_id: str = DEFAULT_SESSION_ID) -> str:
+    """Starts recording the network activity of a session, for export as a HAR file with stop_network_capture.
+
+    The session must have been launched with capture_network=True. Activity from before this call is discarded.
+
+    Args:
+        session_id (str, optional): The browser session to use. Defaults to "default".
+
+    Returns:
+        str: A success message, or an error message if the session cannot capture network activity.
+    """
+    session = sessions.get_session(session_id)
+    if session is None:
+        return _browser_not_launched(session_id)
+    if not session.network_logging:
+        return f"Error: Session '{session_id}' was not launched with capture_network=True. Relaunch it with launch_browser(..., capture_network=True)."
+
+    try:
+        session.driver.get_log("performance")  # Drop everything logged before the capture starts
+        session.network_capture_started = time.time()
+        return f"Started capturing network activity for session '{session_id}'."
+    except WebDriverException as e:
+        return f"ChromeDriver error: {str(e)}"
+    except Exception as e:
+        return f"Failed to start network capture: {str(e)}"
+
+
+@mcp.tool()
+def stop_network_capture(filename: Optional[str] = None, top: int = 10, session_id: str = DEFAULT_SESSION_ID) -> str:
+    """Stops recording network activity, saves it as a HAR file and summarizes it.
+
+    The HAR file has one entry per request with its headers, status, timings (blocked, DNS, connect, SSL,
+    send, wait, receive), sizes and initiator, and opens in browser DevTools and HAR viewers.
+
+    Args:
+        filename (str, optional): The name of the HAR file in the downloads directory. Defaults to
+            "network_<session_id>_<time>.har".
+        top (int, optional): The number of slowest and largest requests (and busiest hosts) to list. Defaults to 10.
+        session_id (str, optional): The browser session to use. Defaults to "default".
+
+    Returns:
+        str: A JSON-formatted string with the HAR file path and a summary: request count, failed requests,
+             transferred and content bytes, duration, the slowest and largest requests, and bytes per
+             resource type and host. Returns an error message if no capture is running or if there's an issue.
+    """
+    session = sessions.get_session(session_id)
+    if session is None:
+        return _browser_not_launched(session_id)
+    if session.network_capture_started is None:
+        return f"Error: No network capture is running for session '{session_id}'. Start one with start_network_capture."
+
+    try:
+        events = _read_network_events(session.driver)
+        captured_seconds = round(time.time() - session.network_capture_started, 1)
+        session.network_capture_started = None
+        har = _build_har(events)
+
+        if not os.path.exists(DEFAULT_DOWNLOAD_PATH):
+            os.makedirs(DEFAULT_DOWNLOAD_PATH)
+        filename = filename or f"network_{session_id}_{time.strftime('%Y%m%d-%H%M%S')}.har"
+        filepath = os.path.join(DEFAULT_DOWNLOAD_PATH, filename)
+        with open(filepath, "w") as f:
+            json.dump(har, f)
+
+        return json.dumps({"har_path": filepath, "captured_seconds": captured_seconds, **_summarize_har(har, top)}, indent=4)
+    except WebDriverException as e:
+        return f"ChromeDriver error: {str(e)}"
+    except Exception as e:
+        return f"Failed to stop network capture: {str(e)}"
+
+
+
+# Performance metrics: timings and Web Vitals are read in the page, runtime counters through DevTools.
+_PERFORMANCE_SECTIONS = ("navigation", "paint", "resources", "web_vitals", "runtime")
+
+# Counters of the DevTools Performance.getMetrics command returned in the 'runtime' section, by output name.
+_RUNTIME_METRICS = {
+    "JSHeapUsedSize": "js_heap_used_bytes",
+    "JSHeapTotalSize": "js_heap_total_bytes",
+    "Nodes": "dom_nodes",
+    "Documents": "documents",
+    "Frames": "frames",
+    "JSEventListeners": "event_listeners",
+    "LayoutCount": "layout_count",
+    "RecalcStyleCount": "recalc_style_count",
+    "LayoutDuration": "layout_ms",
+    "RecalcStyleDuration": "recalc_style_ms",
+    "ScriptDuration": "script_ms",
+    "TaskDuration": "task_ms",
+}
+
+# Good / poor thresholds published with Web Vitals; values in between need improvement.
+_VITALS_THRESHOLDS = {
+    "ttfb_ms": (800, 1800),
+    "fcp_ms": (1800, 3000),
+    "lcp_ms": (2500, 4000),
+    "cls": (0.1, 0.25),
+    "inp_ms": (200, 500),
+}
+
+_PERFORMANCE_METRICS_JS = """
+var sections = arguments[0], top = arguments[1];
+var done = arguments[arguments.length - 1];
+var metrics = {};
+var supported = (window.PerformanceObserver && PerformanceObserver.supportedEntryTypes) || [];
+function ms(value) { return Math.round(value * 10) / 10; }
+function describe(node) {
+    if (!node || !node.tagName) return null;
+    var name = node.tagName.toLowerCase();
+    if (node.id) name += '#' + node.id;
+    else if (typeof node.className === 'string' && node.className.trim()) name += '.' + node.className.trim().split(/\\s+/).join('.');
+    return name;
+}
+
+var navigation = performance.getEntriesByType('navigation')[0];
+if (sections.indexOf('navigation') !== -1 && navigation) {
+    metrics.navigation = {
+        type: navigation.type,
+        protocol: navigation.nextHopProtocol,
+        redirect_count: navigation.redirectCount,
+        redirect_ms: ms(navigation.redirectEnd - navigation.redirectStart),
+        dns_ms: ms(navigation.domainLookupEnd - navigation.domainLookupStart),
+        connect_ms: ms(navigation.connectEnd - navigation.connectStart),
+        tls_ms: navigation.secureConnectionStart > 0 ? ms(navigation.connectEnd - navigation.secureConnectionStart) : 0,
+        ttfb_ms: ms(navigation.responseStart - navigation.startTime),
+        response_ms: ms(navigation.responseEnd - navigation.responseStart),
+        dom_interactive_ms: ms(navigation.domInteractive),
+        dom_content_loaded_ms: ms(navigation.domContentLoadedEventEnd),
+        load_ms: ms(navigation.loadEventEnd),
+        transfer_size: navigation.transferSize,
+        encoded_body_size: navigation.encodedBodySize,
+        decoded_body_size: navigation.decodedBodySize
+    };
+}
+
+if (sections.indexOf('paint') !== -1) {
+    metrics.paint = {};
+    performance.getEntriesByType('paint').forEach(function (entry) {
+        metrics.paint[entry.name.replace(/-/g, '_') + '_ms'] = ms(entry.startTime);
+    });
+}
+
+if (sections.indexOf('resources') !== -1) {
+    var resources = performance.getEntriesByType('resource');
+    var byType = {}, totals = {requests: resources.length, transfer_size: 0, decoded_body_size: 0, cached: 0,
+                               third_party: 0, render_blocking: 0};
+    resources.forEach(function (entry) {
+        var type = byType[entry.initiatorType] = byType[entry.initiatorType] || {requests: 0, transfer_size: 0, duration_ms: 0};
+        type.requests += 1;
+        type.transfer_size += entry.transferSize;
+        type.duration_ms = ms(type.duration_ms + entry.duration);
+        totals.transfer_size += entry.transferSize;
+        totals.decoded_body_size += entry.decodedBodySize;
+        if (entry.transferSize === 0 && entry.decodedBodySize > 0) totals.cached += 1;
+        if (entry.renderBlockingStatus === 'blocking') totals.render_blocking += 1;
+        try { if (new URL(entry.name).host !== location.host) totals.third_party += 1; } catch (e) {}
+    });
+    function brief(entry) {
+        return {url: entry.name, type: entry.initiatorType, duration_ms: ms(entry.duration), transfer_size: entry.transferSize};
+    }
+    totals.by_type = byType;
+    totals.slowest = resources.slice().sort(function (a, b) { return b.duration - a.duration; }).slice(0, top).map(brief);
+    totals.largest = resources.slice().sort(function (a, b) { return b.transferSize - a.transferSize; }).slice(0, top).map(brief);
+    metrics.resources = totals;
+}
+
+if (sections.indexOf('web_vitals') === -1) {
+    done(metrics);
+    return;
+}
+
+// Buffered observers replay the entries recorded since navigation, then the callbacks run asynchronously.
+var vitals = {lcp_ms: null, lcp_element: null, lcp_url: null, cls: 0, inp_ms: null, interactions: 0};
+var fcp = performance.getEntriesByName('first-contentful-paint')[0];
+vitals.fcp_ms = fcp ? ms(fcp.startTime) : null;
+vitals.ttfb_ms = navigation ? ms(navigation.responseStart - navigation.startTime) : null;
+var observers = [], shifts = [], interactions = {};
+function observe(type, handler, options) {
+    if (supported.indexOf(type) === -1) return;
+    var observer = new PerformanceObserver(function (list) { list.getEntries().forEach(handler); });
+    observer.observe(Object.assign({type: type, buffered: true}, options || {}));
+    observers.push(observer);
+}
+observe('largest-contentful-paint', function (entry) {
+    vitals.lcp_ms = ms(entry.startTime);
+    vitals.lcp_element = describe(entry.element);
+    vitals.lcp_url = entry.url || null;
+});
+observe('layout-shift', function (entry) {
+    if (!entry.hadRecentInput) shifts.push(entry);
+});
+observe('event', function (entry) {
+    if (entry.interactionId) interactions[entry.interactionId] = Math.max(interactions[entry.interactionId] || 0, entry.duration);
+}, {durationThreshold: 16});
+observe('first-input', function (entry) {
+    if (entry.interactionId) interactions[entry.interactionId] = Math.max(interactions[entry.interactionId] || 0, entry.duration);
+});
+
+setTimeout(function () {
+    observers.forEach(function (observer) {
+        observer.takeRecords();
+        observer.disconnect();
+    });
+    // CLS: the largest session window of shifts less than 1 s apart and spanning at most 5 s.
+    var sessionValue = 0, sessionStart = 0, previous = 0;
+    shifts.forEach(function (entry) {
+        if (entry.startTime - previous > 1000 || entry.startTime - sessionStart > 5000) {
+            sessionValue = 0;
+            sessionStart = entry.startTime;
+        }
+        sessionValue += entry.value;
+        previous = entry.startTime;
+        vitals.cls = Math.max(vitals.cls, sessionValue);
+    });
+    vitals.cls = Math.round(vitals.cls * 10000) / 10000;
+    // INP: the worst interaction, or one per 50 interactions is ignored as an outlier (98th percentile).
+    var durations = Object.keys(interactions).map(function (id) { return interactions[id]; }).sort(function (a, b) { return b - a; });
+    vitals.interactions = durations.length;
+    if (durations.length) vitals.inp_ms = durations[Math.min(Math.floor(durations.length / 50), durations.length - 1)];
+    metrics.web_vitals = vitals;
+    done(metrics);
+}, 50);
+"""
+
+
+def _rate_vital(name: str, value) -> Optional[str]:
+    if value is None or name not in _VITALS_THRESHOLDS:
+        return None
+    good, poor = _VITALS_THRESHOLDS[name]
+    return "good" if value <= good else "poor" if value > poor else "needs-improvement"
+
+
+@mcp.tool()
+def get_performance_metrics(sections: Optional[List[str]] = None, top: int = 5, session_id: str = DEFAULT_SESSION_ID) -> str:
+    """
+    Retrieves performance metrics of the current page for a lightweight front-end audit.
+
+    Timings and Web Vitals are read by one script execution using the page's
+    Performance APIs; heap and DOM counters come from the DevTools
+    Performance.getMetrics command. Web Vitals are lab approximations: INP
+    only reflects interactions that happened in this session.
+
+    Args:
+        sections (list of str, optional): The sections to include: 'navigation' (Navigation Timing: redirect,
+            DNS, connect, TLS, TTFB, DOM content loaded and load times, document sizes), 'paint' (first paint
+            and first contentful paint), 'resources' (Resource Timing totals, per initiator type, and the
+            slowest and largest resources), 'web_vitals' (TTFB, FCP, LCP with its element, CLS and INP, each
+            rated good, needs-improvement or poor) and 'runtime' (JS heap size, DOM nodes, documents, frames,
+            event listeners, layout and style recalculation counts and durations). Defaults to all of them.
+        top (int, optional): The number of slowest and largest resources to list. Defaults to 5.
+        session_id (str, optional): The browser session to use. Defaults to "default".
+
+    Returns:
+        str: A JSON-formatted string containing the selected metrics, with times in milliseconds and sizes in
+             bytes, or an error message if the browser is not launched or if there's an issue.
+    """
+    driver = sessions.get(session_id)
+    if driver is None:
+        return _browser_not_launched(session_id)
+
+    sections = list(sections) if sections else list(_PERFORMANCE_SECTIONS)
+    unknown = [section for section in sections if section not in _PERFORMANCE_SECTIONS]
+    if unknown:
+        return f"Error: Unknown section(s): {', '.join(unknown)}. Supported sections are: {', '.join(_PERFORMANCE_SECTIONS)}"
+
+    try:
+        metrics = {"url": driver.current_url}
+        page_sections = [section for section in sections if section != "runtime"]
+        if page_sections:
+            metrics.update(driver.execute_async_script(_PERFORMANCE_METRICS_JS, page_sections, top) or {})
+        if "web_vitals" in metrics:
+            vitals = metrics["web_vitals"]
+            vitals["ratings"] = {name: _rate_vital(name, vitals.get(name)) for name in _VITALS_THRESHOLDS}
+
+        if "runtime" in sections:
+            driver.execute_cdp_cmd("Performance.enable", {})
+            try:
+                counters = driver.execute_cdp_cmd("Performance.getMetrics", {}).get("metrics", [])
+            finally:
+                driver.execute_cdp_cmd("Performance.disable", {})
+            values = {counter["name"]: counter["value"] for counter in counters}
+            runtime = {}
+            for name, key in _RUNTIME_METRICS.items():
+                if name in values:
+                    # Durations are reported in seconds
+                    runtime[key] = round(values[name] * 1000, 1) if key.endswith("_ms") else int(values[name])
+            metrics["runtime"] = runtime
+
+        return json.dumps(metrics, indent=4, default=str)
+
+    except WebDriverException as e:
+        return f"ChromeDriver error: {str(e)}"
+    except Exception as e:
+        return f"Failed to retrieve performance metrics: {str(e)}"
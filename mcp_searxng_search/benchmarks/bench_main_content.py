@@ -0,0 +1,48 @@
+"""
+Benchmark for main-content extraction in fetch_and_clean.
+
+Converts the saved article pages in benchmarks/fixtures to markdown twice, once
+from the full page and once after main-content extraction (FETCH_MAIN_CONTENT),
+and reports the output size and conversion time per page for each:
+
+    uv run python benchmarks/bench_main_content.py
+"""
+import argparse
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("SEARXNG_BASE_URL", "http://127.0.0.1:8888")
+
+from mcp_searxng_search.server import _html_to_markdown  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+
+
+def time_per_page(html_content, main_content, iterations):
+    """Returns the markdown output and the mean conversion time per page in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        markdown = _html_to_markdown(html_content, main_content)
+    return markdown, (time.perf_counter() - start) * 1000 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark main-content extraction.")
+    parser.add_argument("--iterations", type=int, default=20, help="Conversions per page and mode (default: 20).")
+    args = parser.parse_args()
+
+    print(f"{'page':<24}{'html':>9}{'full chars':>12}{'main chars':>12}{'full ms':>10}{'main ms':>10}")
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, "doc_*.html"))):
+        with open(path, encoding="utf-8") as f:
+            html_content = f.read()
+        full, full_ms = time_per_page(html_content, False, args.iterations)
+        main_text, main_ms = time_per_page(html_content, True, args.iterations)
+        name = os.path.splitext(os.path.basename(path))[0]
+        print(f"{name:<24}{len(html_content):>9}{len(full):>12}{len(main_text):>12}{full_ms:>10.2f}{main_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Micro-benchmark for SearxNG result page parsing.
+
+Compares the original BeautifulSoup ('html.parser') walk that the search tools
+used to run against the single-pass lxml extractor in server.py, over the saved
+result pages in benchmarks/fixtures. The baseline needs beautifulsoup4, which is
+available through the "bench" extra:
+
+    uv run --extra bench python benchmarks/bench_parse.py
+"""
+import argparse
+import os
+import sys
+import time
+
+from bs4 import BeautifulSoup
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("SEARXNG_BASE_URL", "http://127.0.0.1:8888")
+
+from mcp_searxng_search.server import _parse_html_results  # noqa: E402
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+FIXTURES = {
+    "general": "searxng_general.html",
+    "news": "searxng_news.html",
+    "images": "searxng_images.html",
+    "files": "searxng_files.html",
+}
+
+
+def baseline_parse(html_content, category, max_results):
+    """The per-article find/find_all walk the search tools used before the lxml extractor."""
+    soup = BeautifulSoup(html_content, 'html.parser')
+    results = []
+    if category == "images":
+        for article in soup.find_all('article', class_='result result-images category-images')[:max_results]:
+            url_header = article.find('a')
+            if url_header:
+                url = url_header['href']
+                title = article.find('span', class_='title').text.strip() if article.find('span', class_='title') else "No Title"
+                thumbnail = article.find('img', class_='image_thumbnail')
+                thumbnail_url = thumbnail['src'] if thumbnail else None
+                results.append({'title': title, 'url': url, 'thumbnail': thumbnail_url})
+    elif category == "files":
+        for article in soup.find_all('article', class_='result', limit=max_results):
+            result = {}
+            url_header = article.find('a', class_='url_header')
+            if url_header:
+                result['url'] = url_header['href']
+                result['title'] = article.find('h3').text.strip() if article.find('h3') else "No Title"
+            altlink = article.find('p', class_='altlink')
+            if altlink:
+                magnet_link = altlink.find('a', href=lambda href: href and "magnet:" in href)
+                if magnet_link:
+                    result['magnet'] = magnet_link['href']
+            stat_elements = article.find_all('p', class_='stat')
+            seeders = "N/A"
+            leechers = "N/A"
+            if len(stat_elements) >= 1:
+                seeder_element = stat_elements[0].find('span', class_='badge')
+                if seeder_element:
+                    seeders = seeder_element.text.replace("Seeder", "").strip()
+            if len(stat_elements) >= 2:
+                leech_element = stat_elements[1].find('span', class_='badge')
+                if leech_element:
+                    leechers = leech_element.text.replace("Leecher", "").strip()
+            result['seeders'] = seeders
+            result['leechers'] = leechers
+            results.append(result)
+    else:
+        for article in soup.find_all('article', class_='result')[:max_results]:
+            url_header = article.find('a', class_='url_header')
+            if url_header:
+                url = url_header['href']
+                title = article.find('h3').text.strip() if article.find('h3') else "No Title"
+                description = article.find('p', class_='content').text.strip() if article.find('p', class_='content') else "No Description"
+                results.append({'title': title, 'url': url, 'content': description})
+    return results
+
+
+def time_per_page(parse, html_content, category, max_results, iterations):
+    """Returns the mean parse time per page in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        parse(html_content, category, max_results)
+    return (time.perf_counter() - start) * 1000 / iterations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark SearxNG result page parsing.")
+    parser.add_argument("--iterations", type=int, default=50, help="Parses per page and backend (default: 50).")
+    parser.add_argument("--max-results", type=int, default=30, help="max_results passed to the parsers (default: 30).")
+    args = parser.parse_args()
+
+    print(f"{'page':<10}{'size':>10}{'results':>9}{'bs4 ms':>10}{'lxml ms':>10}{'speedup':>9}")
+    for category, filename in FIXTURES.items():
+        with open(os.path.join(FIXTURES_DIR, filename), encoding="utf-8") as f:
+            html_content = f.read()
+
+        expected = baseline_parse(html_content, category, args.max_results)
+        actual = _parse_html_results(html_content, category, args.max_results)
+        if actual != expected:
+            raise SystemExit(f"{filename}: lxml extractor output differs from the baseline")
+
+        before = time_per_page(baseline_parse, html_content, category, args.max_results, args.iterations)
+        after = time_per_page(_parse_html_results, html_content, category, args.max_results, args.iterations)
+        print(f"{category:<10}{len(html_content):>10}{len(actual):>9}{before:>10.2f}{after:>10.2f}{before / after:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,300 @@
+"""
+Offline load benchmark for the searxng_* tools and fetch_and_clean.
+
+Starts a local HTTP stand-in that serves the recorded SearxNG result pages in
+benchmarks/fixtures (HTML, and JSON for SEARXNG_JSON_API mode) split into result
+pages, plus the saved HTML and PDF documents. Every tool is then called
+`--requests` times at each `--concurrency` level, and the throughput and latency
+percentiles are written as a JSON report:
+
+    uv run python benchmarks/bench_tools.py --concurrency 1 8 --output report.json
+
+The search and document caches are disabled so every call does the full
+request/parse/convert work. Pass `--baseline` with an earlier report to compare
+against it; the script exits with status 1 if any tool got slower than
+`--tolerance` allows.
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs
+
+from lxml import html as lxml_html
+
+FIXTURES_DIR = os.path.join(os.path.dirname(__file__), "fixtures")
+CATEGORIES = ("general", "news", "images", "files")
+DOCUMENTS = {
+    "doc_blog_post.html": "text/html; charset=utf-8",
+    "doc_news_article.html": "text/html; charset=utf-8",
+    "doc_reference_page.html": "text/html; charset=utf-8",
+    "doc_report.pdf": "application/pdf",
+}
+
+
+def split_html_pages(html_content, page_size):
+    """Splits a recorded result page into SearxNG result pages of `page_size` articles each."""
+    article_count = len(lxml_html.document_fromstring(html_content).findall(".//article"))
+    pages = []
+    for first in range(0, article_count + 1, page_size):
+        root = lxml_html.document_fromstring(html_content)
+        for index, article in enumerate(root.findall(".//article")):
+            if not first <= index < first + page_size:
+                article.drop_tree()
+        pages.append(lxml_html.tostring(root, encoding="utf-8", doctype="<!DOCTYPE html>"))
+    return pages  # The last page has no results, like SearxNG past the end
+
+
+def split_json_pages(payload, page_size):
+    """Splits a recorded JSON API response into result pages of `page_size` results each."""
+    results = payload["results"]
+    return [
+        json.dumps(dict(payload, results=results[first:first + page_size])).encode("utf-8")
+        for first in range(0, len(results) + 1, page_size)
+    ]
+
+
+class StandInServer(ThreadingHTTPServer):
+    """A SearxNG instance and document host in one, serving the fixtures from memory."""
+
+    daemon_threads = True
+
+    def __init__(self, page_size, latency_ms):
+        super().__init__(("127.0.0.1", 0), StandInHandler)
+        self.latency_ms = latency_ms
+        self.html_pages = {}
+        self.json_pages = {}
+        for category in CATEGORIES:
+            with open(os.path.join(FIXTURES_DIR, f"searxng_{category}.html"), encoding="utf-8") as f:
+                self.html_pages[category] = split_html_pages(f.read(), page_size)
+            with open(os.path.join(FIXTURES_DIR, f"searxng_{category}.json"), encoding="utf-8") as f:
+                self.json_pages[category] = split_json_pages(json.load(f), page_size)
+        self.documents = {}
+        for name, content_type in DOCUMENTS.items():
+            with open(os.path.join(FIXTURES_DIR, name), "rb") as f:
+                self.documents[name] = (f.read(), content_type)
+
+    @property
+    def base_url(self):
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class StandInHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # Keep-alive, so connection pooling shows up in the numbers
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body, content_type):
+        if self.server.latency_ms:
+            time.sleep(self.server.latency_ms / 1000)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_POST(self):
+        form = parse_qs(self.rfile.read(int(self.headers.get("Content-Length", 0))).decode("utf-8"))
+        if self.path != "/search":
+            return self._send(404, b"Not Found", "text/plain")
+        category = form.get("categories", ["general"])[0]
+        if category not in CATEGORIES:
+            category = "general"
+        pageno = int(form.get("pageno", ["1"])[0])
+        if form.get("format", [""])[0] == "json":
+            pages, content_type = self.server.json_pages[category], "application/json"
+        else:
+            pages, content_type = self.server.html_pages[category], "text/html; charset=utf-8"
+        self._send(200, pages[min(pageno, len(pages)) - 1], content_type)
+
+    def do_GET(self):
+        document = self.server.documents.get(self.path.rsplit("/", 1)[-1])
+        if not self.path.startswith("/docs/") or document is None:
+            return self._send(404, b"Not Found", "text/plain")
+        self._send(200, *document)
+
+
+def percentile(sorted_values, p):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return None
+    return sorted_values[max(math.ceil(p / 100 * len(sorted_values)) - 1, 0)]
+
+
+def build_workloads(server, base_url, max_results):
+    """Maps each benchmarked tool to a coroutine function taking the call index."""
+    async def in_thread(function, *args):
+        return await asyncio.to_thread(function, *args)
+
+    html_documents = [name for name in DOCUMENTS if name.endswith(".html")]
+    return {
+        "searxng_search": lambda i: in_thread(server.searxng_search, f"benchmark query {i}", max_results),
+        "searxng_image_search": lambda i: in_thread(server.searxng_image_search, f"benchmark images {i}", max_results),
+        "searxng_news_search": lambda i: in_thread(server.searxng_news_search, f"benchmark news {i}", None, max_results),
+        "searxng_file_search": lambda i: in_thread(server.searxng_file_search, f"benchmark files {i}", None, max_results),
+        "searxng_multi_search": lambda i: server.searxng_multi_search(
+            [f"benchmark multi {i} a", f"benchmark multi {i} b", f"benchmark multi {i} c"], max_results=10),
+        "fetch_and_clean:html": lambda i: server.fetch_and_clean(f"{base_url}/docs/{html_documents[i % len(html_documents)]}"),
+        "fetch_and_clean:pdf": lambda i: server.fetch_and_clean(f"{base_url}/docs/doc_report.pdf"),
+    }
+
+
+async def run_workload(call, requests, concurrency, warmup):
+    """Runs `requests` calls, at most `concurrency` at a time, and summarizes their latencies."""
+    for i in range(warmup):
+        await call(-1 - i)
+
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = []
+
+    async def one(i):
+        async with semaphore:
+            start = time.perf_counter()
+            try:
+                await call(i)
+            except Exception as e:
+                errors.append(f"{type(e).__name__}: {e}")
+                return
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(requests)))
+    duration = time.perf_counter() - start
+
+    latencies.sort()
+    return {
+        "requests": requests,
+        "errors": len(errors),
+        "first_error": errors[0] if errors else None,
+        "duration_s": round(duration, 4),
+        "throughput_rps": round(len(latencies) / duration, 2) if duration else None,
+        "latency_ms": {
+            "min": round(latencies[0], 3) if latencies else None,
+            "mean": round(sum(latencies) / len(latencies), 3) if latencies else None,
+            "p50": round(percentile(latencies, 50), 3) if latencies else None,
+            "p95": round(percentile(latencies, 95), 3) if latencies else None,
+            "max": round(latencies[-1], 3) if latencies else None,
+        },
+    }
+
+
+def compare_to_baseline(results, baseline, tolerance):
+    """Returns a description of every tool/concurrency pair that regressed beyond `tolerance`."""
+    previous = {(entry["tool"], entry["concurrency"]): entry for entry in baseline["results"]}
+    regressions = []
+    for entry in results:
+        before = previous.get((entry["tool"], entry["concurrency"]))
+        if before is None:
+            continue
+        label = f"{entry['tool']} @ concurrency {entry['concurrency']}"
+        old_p95, new_p95 = before["latency_ms"]["p95"], entry["latency_ms"]["p95"]
+        if old_p95 and new_p95 and new_p95 > old_p95 * (1 + tolerance):
+            regressions.append(f"{label}: p95 {old_p95:.1f} ms -> {new_p95:.1f} ms")
+        old_rps, new_rps = before["throughput_rps"], entry["throughput_rps"]
+        if old_rps and new_rps is not None and new_rps < old_rps * (1 - tolerance):
+            regressions.append(f"{label}: throughput {old_rps:.1f} -> {new_rps:.1f} req/s")
+        if entry["errors"] > before["errors"]:
+            regressions.append(f"{label}: {entry['errors']} errors (was {before['errors']})")
+    return regressions
+
+
+async def run(server, workloads, args):
+    executor_size = max(args.concurrency) * 4 + 8  # Tools nest to_thread calls, so leave headroom
+    asyncio.get_running_loop().set_default_executor(ThreadPoolExecutor(max_workers=executor_size))
+    results = []
+    for tool, call in workloads.items():
+        for concurrency in args.concurrency:
+            summary = await run_workload(call, args.requests, concurrency, args.warmup)
+            results.append({"tool": tool, "concurrency": concurrency, **summary})
+            latency = summary["latency_ms"]
+            print(f"{tool:<24}{concurrency:>6}{summary['throughput_rps'] or 0:>10.1f}"
+                  f"{latency['p50'] or 0:>10.2f}{latency['p95'] or 0:>10.2f}{summary['errors']:>8}", file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the SearxNG tools against a local stand-in server.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8], help="Concurrency levels to run each tool at (default: 1 8).")
+    parser.add_argument("--requests", type=int, default=40, help="Measured calls per tool and concurrency level (default: 40).")
+    parser.add_argument("--warmup", type=int, default=2, help="Unmeasured calls before each run (default: 2).")
+    parser.add_argument("--max-results", type=int, default=30, help="max_results for the search tools (default: 30).")
+    parser.add_argument("--page-size", type=int, default=10, help="Results per stand-in SearxNG page (default: 10).")
+    parser.add_argument("--latency-ms", type=float, default=0, help="Delay added to every stand-in response (default: 0).")
+    parser.add_argument("--json-api", action="store_true", help="Run the search tools in SEARXNG_JSON_API mode.")
+    parser.add_argument("--tools", nargs="+", help="Only run these tools (default: all).")
+    parser.add_argument("--output", help="Write the JSON report here instead of to stdout.")
+    parser.add_argument("--baseline", help="Earlier report to compare against.")
+    parser.add_argument("--tolerance", type=float, default=0.25, help="Allowed slowdown against the baseline (default: 0.25).")
+    args = parser.parse_args()
+
+    stand_in = StandInServer(args.page_size, args.latency_ms)
+    threading.Thread(target=stand_in.serve_forever, daemon=True).start()
+
+    # The server reads its configuration at import time.
+    os.environ["SEARXNG_BASE_URL"] = stand_in.base_url
+    os.environ["SEARXNG_JSON_API"] = "true" if args.json_api else "false"
+    os.environ["SEARXNG_CACHE_SIZE"] = "0"
+    os.environ["FETCH_CACHE_MAX_BYTES"] = "0"
+    os.environ["FETCH_PDF_PAGE_CACHE_DOCUMENTS"] = "0"
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+    from mcp_searxng_search import server
+
+    workloads = build_workloads(server, stand_in.base_url, args.max_results)
+    if args.tools:
+        unknown = set(args.tools) - set(workloads)
+        if unknown:
+            parser.error(f"unknown tools: {', '.join(sorted(unknown))} (choose from {', '.join(workloads)})")
+        workloads = {tool: call for tool, call in workloads.items() if tool in args.tools}
+
+    print(f"{'tool':<24}{'conc':>6}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'errors':>8}", file=sys.stderr)
+    results = asyncio.run(run(server, workloads, args))
+    stand_in.shutdown()
+
+    report = {
+        "generated_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "config": {
+            "concurrency": args.concurrency,
+            "requests": args.requests,
+            "warmup": args.warmup,
+            "max_results": args.max_results,
+            "page_size": args.page_size,
+            "latency_ms": args.latency_ms,
+            "json_api": args.json_api,
+        },
+        "results": results,
+    }
+
+    regressions = []
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare_to_baseline(results, json.load(f), args.tolerance)
+        report["regressions"] = regressions
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    if regressions:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,34 @@
 import os
 import requests
-from bs4 import BeautifulSoup
+import urllib3
+from requests.adapters import HTTPAdapter
+from lxml import etree
+from lxml import html as lxml_html
 from mcp.server.fastmcp import FastMCP
 from mcp.shared.exceptions import McpError
 from mcp.types import ErrorData, INTERNAL_ERROR, INVALID_PARAMS
-from typing import List, Dict, Literal, Optional
+from typing import Any, List, Dict, Literal, Optional, Tuple
 import html2text
-from pdfminer.high_level import extract_text
+from pdfminer.converter import TextConverter
+from pdfminer.layout import LAParams
+from pdfminer.pdfdocument import PDFDocument
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
+from pdfminer.pdfparser import PDFParser
+from pdfminer.pdftypes import resolve1
 import io
+import math
+import re
+import asyncio
+import json
+import socket
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from urllib.parse import urlparse
 
 mcp = FastMCP("searxng")
 
@@ -17,12 +38,525 @@ if not SEARXNG_BASE_URL:
 
 USER_AGENT = "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/134.0.0.0 Safari/537.36"
 
+# Connection pool settings for the shared HTTP session.
+HTTP_POOL_CONNECTIONS = int(os.environ.get("SEARXNG_POOL_CONNECTIONS", "10"))  # Number of per-host pools kept around
+HTTP_POOL_MAXSIZE = int(os.environ.get("SEARXNG_POOL_MAXSIZE", "20"))  # Max connections kept open per host
+HTTP_POOL_BLOCK = os.environ.get("SEARXNG_POOL_BLOCK", "false").lower() in ("1", "true", "yes")  # Wait instead of exceeding POOL_MAXSIZE
+HTTP_KEEP_ALIVE = os.environ.get("SEARXNG_KEEP_ALIVE", "true").lower() in ("1", "true", "yes")
+
+
+def _create_session() -> requests.Session:
+    """
+    Creates the long-lived HTTP session shared by all tools.
+
+    Connections are pooled per host and kept alive between calls, so repeated
+    searches against the SearxNG instance reuse an already established TCP/TLS
+    connection instead of doing a fresh handshake every time.
+
+    Returns:
+        A configured requests.Session.
+    """
+    new_session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        pool_block=HTTP_POOL_BLOCK,
+    )
+    new_session.mount("http://", adapter)
+    new_session.mount("https://", adapter)
+    new_session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Connection': 'keep-alive' if HTTP_KEEP_ALIVE else 'close',
+    })
+    return new_session
+
+
+session = _create_session()
+
+# Search result cache settings. A size of 0 disables caching.
+SEARCH_CACHE_SIZE = int(os.environ.get("SEARXNG_CACHE_SIZE", "256"))
+SEARCH_CACHE_DIR = os.environ.get("SEARXNG_CACHE_DIR")  # Enables the on-disk tier when set
+SEARCH_CACHE_DISK_MAX_ENTRIES = int(os.environ.get("SEARXNG_CACHE_DISK_MAX_ENTRIES", "10000"))
+SEARCH_CACHE_TTLS = {
+    "general": int(os.environ.get("SEARXNG_CACHE_TTL_GENERAL", "3600")),
+    "images": int(os.environ.get("SEARXNG_CACHE_TTL_IMAGES", "3600")),
+    "news": int(os.environ.get("SEARXNG_CACHE_TTL_NEWS", "300")),
+    "files": int(os.environ.get("SEARXNG_CACHE_TTL_FILES", "3600")),
+}
+
+
+class SearchCache:
+    """
+    A bounded TTL + LRU cache for search results, with an optional SQLite tier on disk.
+
+    Entries live in memory up to `max_entries`; the least recently used entry is
+    evicted when the cache is full. Each entry expires after the TTL configured
+    for its category. When `disk_dir` is given, entries are also written to a
+    SQLite database there so they survive restarts and memory evictions.
+    """
+
+    def __init__(self, max_entries: int, ttls: Dict[str, int], disk_dir: Optional[str] = None, disk_max_entries: int = 10000):
+        self.max_entries = max_entries
+        self.ttls = ttls
+        self.disk_max_entries = disk_max_entries
+        self._entries = OrderedDict()  # key -> (expires_at, results)
+        self._lock = threading.Lock()
+        self._db = None
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        if disk_dir and max_entries > 0:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._db = sqlite3.connect(os.path.join(disk_dir, "search_cache.sqlite3"), check_same_thread=False)
+            self._db.execute("CREATE TABLE IF NOT EXISTS search_cache (key TEXT PRIMARY KEY, expires_at REAL, results TEXT)")
+            self._db.commit()
+
+    @staticmethod
+    def make_key(query: str, category: str, time_range: Optional[str], max_results: int) -> str:
+        """
+        Builds a cache key from the normalized query and the search parameters.
+
+        The query is lowercased and its whitespace collapsed, so near-identical
+        queries that only differ in case or spacing share one entry.
+        """
+        normalized_query = " ".join(query.lower().split())
+        return json.dumps([normalized_query, category, time_range or "", max_results])
+
+    def get(self, key: str) -> Optional[List[Dict[str, str]]]:
+        """
+        Returns a copy of the cached results for `key`, or None on a miss.
+        """
+        if self.max_entries <= 0:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, results = entry
+                if expires_at > now:
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return [dict(result) for result in results]
+                del self._entries[key]
+                self.expirations += 1
+
+            if self._db is not None:
+                row = self._db.execute("SELECT expires_at, results FROM search_cache WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    expires_at, payload = row
+                    if expires_at > now:
+                        results = json.loads(payload)
+                        self._store(key, expires_at, results)
+                        self.disk_hits += 1
+                        return [dict(result) for result in results]
+                    self._db.execute("DELETE FROM search_cache WHERE key = ?", (key,))
+                    self._db.commit()
+                    self.expirations += 1
+
+            self.misses += 1
+            return None
+
+    def put(self, key: str, category: str, results: List[Dict[str, str]]) -> None:
+        """
+        Stores `results` under `key` with the TTL configured for `category`.
+        """
+        if self.max_entries <= 0:
+            return
+        ttl = self.ttls.get(category, self.ttls.get("general", 3600))
+        if ttl <= 0:
+            return
+        expires_at = time.time() + ttl
+        results = [dict(result) for result in results]
+        with self._lock:
+            self._store(key, expires_at, results)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO search_cache (key, expires_at, results) VALUES (?, ?, ?)",
+                    (key, expires_at, json.dumps(results)),
+                )
+                self._db.execute("DELETE FROM search_cache WHERE expires_at <= ?", (time.time(),))
+                self._db.execute(
+                    "DELETE FROM search_cache WHERE key NOT IN (SELECT key FROM search_cache ORDER BY expires_at DESC LIMIT ?)",
+                    (self.disk_max_entries,),
+                )
+                self._db.commit()
+
+    def _store(self, key: str, expires_at: float, results: List[Dict[str, str]]) -> None:
+        # Caller must hold the lock.
+        self._entries[key] = (expires_at, results)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns the cache counters and current size.
+        """
+        with self._lock:
+            disk_entries = 0
+            if self._db is not None:
+                disk_entries = self._db.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0]
+            return {
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk_entries": disk_entries,
+            }
+
+
+search_cache = SearchCache(SEARCH_CACHE_SIZE, SEARCH_CACHE_TTLS, SEARCH_CACHE_DIR, SEARCH_CACHE_DISK_MAX_ENTRIES)
+
+# Opt-in: query SearxNG's JSON API instead of scraping the HTML result page.
+SEARXNG_JSON_API = os.environ.get("SEARXNG_JSON_API", "false").lower() in ("1", "true", "yes")
+_json_api_available = True  # Flipped off once the instance turns out to have the json format disabled
+
+
+def _searxng_json_search(query: str, category: str, time_range: Optional[str], pageno: int = 1) -> Optional[List[Dict[str, Any]]]:
+    """
+    Runs a search through the SearxNG JSON API.
+
+    Args:
+        query: The search query.
+        category: The SearxNG category to search in.
+        time_range: The time range to filter results by, or None for no time limit.
+        pageno: The result page to fetch, starting at 1.
+
+    Returns:
+        The raw result objects decoded from the JSON response, or None when JSON
+        mode is off, the instance does not serve the json format (403, remembered
+        for the rest of the process) or the answer is not JSON (this call only),
+        in which case the caller should fall back to scraping the HTML page.
+    """
+    global _json_api_available
+    if not SEARXNG_JSON_API or not _json_api_available:
+        return None
+
+    data = {
+        'q': query,
+        'categories': category,
+        'language': 'auto',
+        'time_range': time_range or '',
+        'safesearch': '0',
+        'pageno': str(pageno),
+        'format': 'json',
+    }
+    response = session.post(f"{SEARXNG_BASE_URL}/search", headers={'Accept': 'application/json'}, data=data, verify=False, timeout=30)
+    if response.status_code == 403:
+        # SearxNG answers 403 Forbidden when "json" is missing from search.formats.
+        _json_api_available = False
+        return None
+    response.raise_for_status()
+    try:
+        payload = response.json()
+    except ValueError:
+        # A proxy or captcha page in place of the JSON answer; fall back for this call only.
+        return None
+    if not isinstance(payload, dict):
+        return None
+    return payload.get('results', [])
+
+
+def _json_to_results(json_results: List[Dict[str, Any]], max_results: int) -> List[Dict[str, str]]:
+    """
+    Converts JSON API results into the title/URL/content shape of searxng_search.
+    """
+    results = []
+    for item in json_results:
+        if not item.get('url'):
+            continue
+        results.append({
+            'title': (item.get('title') or '').strip() or "No Title",
+            'url': item['url'],
+            'content': (item.get('content') or '').strip() or "No Description"
+        })
+        if len(results) >= max_results:
+            break
+    return results
+
+
+def _json_to_image_results(json_results: List[Dict[str, Any]], max_results: int) -> List[Dict[str, str]]:
+    """
+    Converts JSON API results into the title/URL/thumbnail shape of searxng_image_search.
+    """
+    results = []
+    for item in json_results:
+        url = item.get('img_src') or item.get('url')
+        if not url:
+            continue
+        results.append({
+            'title': (item.get('title') or '').strip() or "No Title",
+            'url': url,
+            'thumbnail': item.get('thumbnail_src') or item.get('thumbnail') or item.get('img_src')
+        })
+        if len(results) >= max_results:
+            break
+    return results
+
+
+def _json_to_file_results(json_results: List[Dict[str, Any]], max_results: int) -> List[Dict[str, str]]:
+    """
+    Converts JSON API results into the URL/title/magnet/seeders/leechers shape of searxng_file_search.
+    """
+    results = []
+    for item in json_results[:max_results]:
+        result = {}
+        if item.get('url'):
+            result['url'] = item['url']
+            result['title'] = (item.get('title') or '').strip() or "No Title"
+        if item.get('magnetlink'):
+            result['magnet'] = item['magnetlink']
+        result['seeders'] = str(item['seed']) if item.get('seed') is not None else "N/A"
+        result['leechers'] = str(item['leech']) if item.get('leech') is not None else "N/A"
+        results.append(result)
+    return results
+
+
+def _has_class(name: str) -> str:
+    # XPath equivalent of the CSS class selector ".name".
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# Selectors are compiled once at import time and evaluated relative to an <article> node.
+_XPATH_URL_HEADER = etree.XPath(f"(.//a[{_has_class('url_header')}])[1]/@href")  # a.url_header
+_XPATH_H3 = etree.XPath("(.//h3)[1]")  # h3
+_XPATH_CONTENT = etree.XPath(f"(.//p[{_has_class('content')}])[1]")  # p.content
+_XPATH_FIRST_LINK = etree.XPath("(.//a)[1]/@href")  # a
+_XPATH_IMAGE_TITLE = etree.XPath(f"(.//span[{_has_class('title')}])[1]")  # span.title
+_XPATH_THUMBNAIL = etree.XPath(f"(.//img[{_has_class('image_thumbnail')}])[1]/@src")  # img.image_thumbnail
+_XPATH_MAGNET = etree.XPath(f"(.//p[{_has_class('altlink')}])[1]//a[contains(@href, 'magnet:')]/@href")  # p.altlink a[href*="magnet:"]
+_XPATH_STATS = etree.XPath(f".//p[{_has_class('stat')}]")  # p.stat
+_XPATH_BADGE = etree.XPath(f"(.//span[{_has_class('badge')}])[1]")  # span.badge
+
+
+def _node_text(nodes: list) -> Optional[str]:
+    # Stripped text of the first node in `nodes`, or None if there is none.
+    if not nodes:
+        return None
+    return "".join(nodes[0].itertext()).strip()
+
+
+def _extract_result(article) -> Optional[Dict[str, str]]:
+    url = _XPATH_URL_HEADER(article)
+    if not url:
+        return None
+    title = _node_text(_XPATH_H3(article))
+    description = _node_text(_XPATH_CONTENT(article))
+    return {
+        'title': title if title is not None else "No Title",
+        'url': url[0],
+        'content': description if description is not None else "No Description"
+    }
+
+
+def _extract_image_result(article) -> Optional[Dict[str, str]]:
+    if 'result-images' not in (article.get('class') or '').split():
+        return None
+    url = _XPATH_FIRST_LINK(article)
+    if not url:
+        return None
+    title = _node_text(_XPATH_IMAGE_TITLE(article))
+    thumbnail = _XPATH_THUMBNAIL(article)
+    return {
+        'title': title if title is not None else "No Title",
+        'url': url[0],
+        'thumbnail': thumbnail[0] if thumbnail else None
+    }
+
+
+def _extract_file_result(article) -> Optional[Dict[str, str]]:
+    result = {}
+    url = _XPATH_URL_HEADER(article)
+    if url:
+        result['url'] = url[0]
+        title = _node_text(_XPATH_H3(article))
+        result['title'] = title if title is not None else "No Title"
+
+    magnet = _XPATH_MAGNET(article)
+    if magnet:
+        result['magnet'] = magnet[0]
+
+    stat_elements = _XPATH_STATS(article)
+    seeders = "N/A"
+    leechers = "N/A"
+    if len(stat_elements) >= 1:
+        seeder_text = _node_text(_XPATH_BADGE(stat_elements[0]))
+        if seeder_text is not None:
+            seeders = seeder_text.replace("Seeder", "").strip()
+    if len(stat_elements) >= 2:
+        leecher_text = _node_text(_XPATH_BADGE(stat_elements[1]))
+        if leecher_text is not None:
+            leechers = leecher_text.replace("Leecher", "").strip()
+
+    result['seeders'] = seeders
+    result['leechers'] = leechers
+    return result
+
+
+_RESULT_EXTRACTORS = {
+    "general": _extract_result,
+    "news": _extract_result,
+    "images": _extract_image_result,
+    "files": _extract_file_result,
+}
+
+
+HTML_PARSE_CHUNK_SIZE = 16 * 1024  # Characters fed to the pull parser between checks for enough results
+
+
+def _parse_html_results(html_content: str, category: str, max_results: int) -> List[Dict[str, str]]:
+    """
+    Extracts search results from a SearxNG HTML result page in a single pass.
+
+    The page is fed in pieces to lxml's C pull parser, which only reports
+    <article> elements; each one carrying the "result" class is handed to the
+    extractor for `category` and then cleared to keep the tree small. Parsing
+    stops as soon as `max_results` results are extracted, so the rest of the
+    page is never parsed.
+
+    Args:
+        html_content: The HTML of the result page.
+        category: The SearxNG category the page was requested for.
+        max_results: The maximum number of results to extract.
+
+    Returns:
+        A list of result dictionaries in the shape returned by the matching tool.
+    """
+    extract = _RESULT_EXTRACTORS[category]
+    parser = etree.HTMLPullParser(events=("end",), tag="article")
+    results = []
+
+    def drain() -> bool:
+        # Handles the articles parsed so far; returns True once enough results are collected.
+        for _, article in parser.read_events():
+            if len(results) >= max_results:
+                return True
+            if 'result' in (article.get('class') or '').split():
+                result = extract(article)
+                if result is not None:
+                    results.append(result)
+            article.clear()
+        return len(results) >= max_results
+
+    for start in range(0, len(html_content), HTML_PARSE_CHUNK_SIZE):
+        parser.feed(html_content[start:start + HTML_PARSE_CHUNK_SIZE])
+        if drain():
+            return results
+    parser.close()
+    drain()
+    return results
+
+
+SEARCH_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
+    'Accept-Language': 'en-US,en;q=0.9',
+    'Cache-Control': 'no-cache',
+    'Content-Type': 'application/x-www-form-urlencoded',
+    'Pragma': 'no-cache',
+    'Upgrade-Insecure-Requests': '1',
+    'User-Agent': USER_AGENT
+}
+
+_JSON_CONVERTERS = {
+    "general": _json_to_results,
+    "news": _json_to_results,
+    "images": _json_to_image_results,
+    "files": _json_to_file_results,
+}
+
+# Result page fan-out settings.
+SEARXNG_MAX_PAGES = int(os.environ.get("SEARXNG_MAX_PAGES", "10"))  # Highest result page ever requested
+SEARXNG_RESULTS_PER_PAGE = int(os.environ.get("SEARXNG_RESULTS_PER_PAGE", "10"))  # Initial guess, refined from page 1
+_page_executor = ThreadPoolExecutor(max_workers=HTTP_POOL_MAXSIZE, thread_name_prefix="searxng-page")
+
+
+def _searxng_page(query: str, category: str, time_range: Optional[str], pageno: int, max_results: int) -> List[Dict[str, str]]:
+    """
+    Fetches and parses one SearxNG result page, through the JSON API when enabled and otherwise from the HTML.
+    """
+    json_results = _searxng_json_search(query, category, time_range, pageno)
+    if json_results is not None:
+        return _JSON_CONVERTERS[category](json_results, max_results)
+
+    data = {
+        'q': query,
+        'categories': category,
+        'language': 'auto',
+        'time_range': time_range or '',
+        'safesearch': '0',
+        'pageno': str(pageno),
+        'theme': 'simple',
+    }
+    response = session.post(f"{SEARXNG_BASE_URL}/search", headers=SEARCH_HEADERS, data=data, verify=False, timeout=30)
+    response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
+    return _parse_html_results(response.text, category, max_results)
+
+
+def _searxng_search_pages(query: str, category: str, time_range: Optional[str], max_results: int) -> List[Dict[str, str]]:
+    """
+    Collects up to `max_results` results, fetching as many result pages as needed.
+
+    Pages are requested concurrently in waves sized from the expected number of
+    results per page, and merged in page order with duplicate URLs dropped. The
+    fan-out stops as soon as `max_results` is reached, when a page adds no new
+    results, or after SEARXNG_MAX_PAGES pages. Errors on the first page are
+    raised; an error on a later page ends the search there, and the pages after
+    it are not merged even if they were already fetched.
+    """
+    results = []
+    seen = set()
+    per_page = SEARXNG_RESULTS_PER_PAGE
+    pageno = 1
+    while len(results) < max_results and pageno <= SEARXNG_MAX_PAGES:
+        wanted_pages = math.ceil((max_results - len(results)) / max(per_page, 1))
+        wave = list(range(pageno, min(pageno + wanted_pages, SEARXNG_MAX_PAGES + 1)))
+        futures = [_page_executor.submit(_searxng_page, query, category, time_range, page, max_results) for page in wave]
+
+        exhausted = False
+        for page, future in zip(wave, futures):
+            try:
+                page_results = future.result()
+            except Exception:
+                if page == 1:
+                    raise
+                page_results = []
+            if page == 1 and page_results:
+                per_page = len(page_results)
+            added = 0
+            for result in page_results:
+                key = result.get('url') or result.get('magnet')
+                if key is not None:
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                results.append(result)
+                added += 1
+            if added == 0:
+                # Merging the pages after a failed or empty one would leave a gap in the results.
+                exhausted = True
+                for later in futures:
+                    later.cancel()
+                break
+        if exhausted:
+            break
+        pageno = wave[-1] + 1
+    return results[:max_results]
+
 
 @mcp.tool()
 def searxng_search(query: str, max_results: int = 30) -> List[Dict[str, str]]:
     """
     Searches the web using a SearxNG instance and returns a list of results.
 
+    As many SearxNG result pages as needed to reach `max_results` are fetched
+    concurrently and merged, with duplicate URLs removed.
+
     Args:
         query: The search query.
         max_results: The maximum number of results to return. Defaults to 30.
@@ -38,38 +572,16 @@ def searxng_search(query: str, max_results: int = 30) -> List[Dict[str, str]]:
     if not query:
         return [{'error': 'No Query Submitted'}]
 
-    search_url = f"{SEARXNG_BASE_URL}/search"
-    headers = {
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Cache-Control': 'no-cache',
-        'Connection': 'keep-alive',
-        'Content-Type': 'application/x-www-form-urlencoded',
-        'Pragma': 'no-cache',
-        'Upgrade-Insecure-Requests': '1',
-        'User-Agent': USER_AGENT
-    }
-    data = f"q={query}&categories=general&language=auto&time_range=&safesearch=0&theme=simple"
+    cache_key = search_cache.make_key(query, "general", None, max_results)
+    cached_results = search_cache.get(cache_key)
+    if cached_results is not None:
+        return cached_results
 
     try:
-        response = requests.post(search_url, headers=headers, data=data, verify=False, timeout=30)
-        response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-        html_content = response.text
-        soup = BeautifulSoup(html_content, 'html.parser')
-        results = []
-        for article in soup.find_all('article', class_='result')[:max_results]:
-            url_header = article.find('a', class_='url_header')
-            if url_header:
-                url = url_header['href']
-                title = article.find('h3').text.strip() if article.find('h3') else "No Title"
-                description = article.find('p', class_='content').text.strip() if article.find('p', class_='content') else "No Description"
-                results.append({
-                    'title': title,
-                    'url': url,
-                    'content': description
-                })
+        results = _searxng_search_pages(query, "general", None, max_results)
         if not results:
             return [{"error": "No results found for the given query."}]
+        search_cache.put(cache_key, "general", results)
         return results
     except requests.exceptions.RequestException as e:
         raise McpError(ErrorData(INTERNAL_ERROR, f"Error during search: {str(e)}"))
@@ -93,40 +605,16 @@ def searxng_image_search(query: str, max_results: int = 30) -> List[Dict[str, st
     if max_results <= 0:
         raise McpError(ErrorData(INVALID_PARAMS, "max_results must be greater than 0."))
 
-    search_url = f"{SEARXNG_BASE_URL}/search"
-    headers = {
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Cache-Control': 'no-cache',
-        'Connection': 'keep-alive',
-        'Content-Type': 'application/x-www-form-urlencoded',
-        'Pragma': 'no-cache',
-        'Upgrade-Insecure-Requests': '1',
-        'User-Agent': USER_AGENT
-    }
-    data = f"q={query}&categories=images&language=auto&time_range=&safesearch=0&theme=simple"
+    cache_key = search_cache.make_key(query, "images", None, max_results)
+    cached_results = search_cache.get(cache_key)
+    if cached_results is not None:
+        return cached_results
 
     try:
-        response = requests.post(search_url, headers=headers, data=data, verify=False, timeout=30)
-        response.raise_for_status()
-        html_content = response.text
-        soup = BeautifulSoup(html_content, 'html.parser')
-        results = []
-        for article in soup.find_all('article', class_='result result-images category-images')[:max_results]:
-            url_header = article.find('a')
-            if url_header:
-                url = url_header['href']
-                title = article.find('span', class_='title').text.strip() if article.find('span', class_='title') else "No Title"
-                thumbnail = article.find('img', class_='image_thumbnail')
-                thumbnail_url = thumbnail['src'] if thumbnail else None
-
-                results.append({
-                    'title': title,
-                    'url': url,
-                    'thumbnail': thumbnail_url
-                })
+        results = _searxng_search_pages(query, "images", None, max_results)
         if not results:
             return [{"error": "No image results found for the given query."}]
+        search_cache.put(cache_key, "images", results)
         return results
     except requests.exceptions.RequestException as e:
         raise McpError(ErrorData(INTERNAL_ERROR, f"Error during image search: {str(e)}"))
@@ -134,42 +622,801 @@ def searxng_image_search(query: str, max_results: int = 30) -> List[Dict[str, st
         raise McpError(ErrorData(INTERNAL_ERROR, f"Unexpected error: {str(e)}"))
 
 
-@mcp.tool()
-def fetch_and_clean(url: str) -> str:
+# Limits applied while downloading documents in fetch_and_clean.
+FETCH_MAX_BYTES = int(os.environ.get("FETCH_MAX_BYTES", str(20 * 1024 * 1024)))  # Cap on decoded (decompressed) body size
+FETCH_MAX_SECONDS = float(os.environ.get("FETCH_MAX_SECONDS", "30"))  # Cap on total download time
+FETCH_MAX_COMPRESSION_RATIO = int(os.environ.get("FETCH_MAX_COMPRESSION_RATIO", "100"))  # Decoded/raw ratio treated as a decompression bomb
+FETCH_CHUNK_SIZE = 16 * 1024  # Upper bound of one read; reads return as soon as any data has arrived
+
+# Content types fetch_and_clean cannot turn into text; these are rejected from the headers alone.
+UNSUPPORTED_CONTENT_TYPES = ("image/", "audio/", "video/", "font/", "application/octet-stream", "application/zip", "application/gzip", "application/x-tar")
+
+
+class DownloadRejected(Exception):
+    """Raised when a download is refused from its response headers, before the body is read."""
+
+
+@dataclass
+class FetchedDocument:
+    """The (possibly truncated) body of a downloaded document."""
+    url: str
+    content: bytes
+    content_type: str
+    encoding: Optional[str]
+    truncated: bool = False
+    truncated_reason: Optional[str] = None
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    not_modified: bool = False  # True for a 304 answer to a conditional request; content is empty
+
+    @property
+    def is_pdf(self) -> bool:
+        return 'application/pdf' in self.content_type
+
+    def text(self) -> str:
+        return self.content.decode(self.encoding or 'utf-8', errors='replace')
+
+
+def _download(url: str, headers: Optional[Dict[str, str]] = None, deadline: Optional[float] = None) -> FetchedDocument:
     """
-    Fetches content from a URL, determines the content type (HTML or PDF),
-    cleans the text, and returns the cleaned text.
+    Streams a document into memory in chunks, enforcing the size and time caps.
+
+    The download is refused up front when the Content-Type cannot be converted
+    to text, or when a PDF announces a Content-Length above FETCH_MAX_BYTES (a
+    partial PDF cannot be parsed). Otherwise the body is read until it is
+    complete or a cap is hit, in which case the partial body is returned with
+    `truncated` set. Compressed bodies are decoded on the fly and the cap applies
+    to the decoded size, so a small compressed response cannot expand unchecked.
 
     Args:
-        url: The URL to fetch and clean.
+        url: The URL to download.
+        headers: Extra request headers, such as conditional request validators.
+        deadline: A time.monotonic() value after which the download is abandoned
+            with TimeoutError instead of returning a partial body.
 
     Returns:
-        The cleaned text content of the URL.
+        A FetchedDocument with the body read so far.
     """
+    truncate_at = time.monotonic() + FETCH_MAX_SECONDS
+    request_timeout = 30
+    if deadline is not None:
+        request_timeout = min(request_timeout, max(deadline - time.monotonic(), 0.1))
     try:
-        response = requests.get(url, headers={'User-Agent': USER_AGENT}, timeout=30)
+        return _read_response(url, headers, request_timeout, truncate_at, deadline)
+    except requests.exceptions.RequestException as e:
+        # The socket timeouts are capped at the deadline, so reaching it surfaces as a request error.
+        if deadline is not None and time.monotonic() >= deadline:
+            raise TimeoutError(f"Download of {url} abandoned at its deadline.") from e
+        raise
+
+
+def _response_socket(raw) -> Optional[socket.socket]:
+    # The socket under a urllib3 response, so each read can get its own timeout. A response that closes the
+    # connection when done is detached from it; its socket is then only reachable through the file object.
+    sock = getattr(getattr(raw, "connection", None), "sock", None)
+    if sock is None:
+        sock = getattr(getattr(getattr(getattr(raw, "_fp", None), "fp", None), "raw", None), "_sock", None)
+    return sock if isinstance(sock, socket.socket) else None
+
+
+def _read_response(url: str, headers: Optional[Dict[str, str]], request_timeout: float, truncate_at: float,
+                   deadline: Optional[float]) -> FetchedDocument:
+    # The streaming part of _download.
+    with session.get(url, headers=headers, timeout=request_timeout, stream=True) as response:
         response.raise_for_status()
         content_type = response.headers.get('Content-Type', '').lower()
+        if response.status_code == 304:
+            return FetchedDocument(
+                url=url,
+                content=b"",
+                content_type=content_type,
+                encoding=None,
+                etag=response.headers.get('ETag'),
+                last_modified=response.headers.get('Last-Modified'),
+                not_modified=True,
+            )
+        if content_type.startswith(UNSUPPORTED_CONTENT_TYPES):
+            raise DownloadRejected(f"Unsupported content type: {content_type}")
+
+        content_length = response.headers.get('Content-Length')
+        if content_length and content_length.isdigit() and int(content_length) > FETCH_MAX_BYTES and 'application/pdf' in content_type:
+            raise DownloadRejected(f"PDF is {content_length} bytes, which exceeds the {FETCH_MAX_BYTES} byte limit.")
+
+        chunks = []
+        received = 0
+        truncated_reason = None
+        raw = response.raw
+        read = getattr(raw, "read1", raw.read)  # read1 returns whatever one socket read brings (urllib3 2)
+        sock = _response_socket(raw)
+        while True:
+            # The clocks are checked between reads, and each read may block only until the nearer one runs out,
+            # so a server trickling bytes cannot stretch the download past either limit.
+            now = time.monotonic()
+            if deadline is not None and now > deadline:
+                raise TimeoutError(f"Download of {url} abandoned at its deadline.")
+            if now > truncate_at:
+                truncated_reason = f"time limit of {FETCH_MAX_SECONDS:g} seconds reached"
+                break
+            limit = min(truncate_at, deadline) if deadline is not None else truncate_at
+            if sock is not None:
+                sock.settimeout(max(min(limit - now, request_timeout), 0.01))
+            try:
+                chunk = read(FETCH_CHUNK_SIZE, decode_content=True)
+            except (socket.timeout, urllib3.exceptions.ReadTimeoutError) as e:
+                if time.monotonic() < limit:
+                    raise requests.exceptions.ConnectionError(e)
+                continue
+            # Raised as the same requests exceptions iter_content would raise.
+            except urllib3.exceptions.ProtocolError as e:
+                raise requests.exceptions.ChunkedEncodingError(e)
+            except urllib3.exceptions.DecodeError as e:
+                raise requests.exceptions.ContentDecodingError(e)
+            if not chunk:
+                break
+            if received + len(chunk) > FETCH_MAX_BYTES:
+                chunks.append(chunk[:FETCH_MAX_BYTES - received])
+                received = FETCH_MAX_BYTES
+                truncated_reason = f"size limit of {FETCH_MAX_BYTES} bytes reached"
+                break
+            chunks.append(chunk)
+            received += len(chunk)
+            raw_received = response.raw.tell()
+            if raw_received and received > FETCH_CHUNK_SIZE and received > raw_received * FETCH_MAX_COMPRESSION_RATIO:
+                truncated_reason = f"decompression ratio above {FETCH_MAX_COMPRESSION_RATIO}:1"
+                break
+
+        return FetchedDocument(
+            url=url,
+            content=b"".join(chunks),
+            content_type=content_type,
+            encoding=requests.utils.get_encoding_from_headers(response.headers) if 'charset=' in content_type else None,
+            truncated=truncated_reason is not None,
+            truncated_reason=truncated_reason,
+            etag=response.headers.get('ETag'),
+            last_modified=response.headers.get('Last-Modified'),
+        )
+
+
+# HTML conversion and PDF text extraction run in a process pool so documents are
+# converted on every core and do not hold up the server's event loop.
+FETCH_WORKERS = int(os.environ.get("FETCH_WORKERS", str(os.cpu_count() or 1)))
+PDF_MIN_PAGES_PER_TASK = 4  # Smaller chunks cost more in pickling the PDF than they save
+PDF_PAGE_CACHE_DOCUMENTS = int(os.environ.get("FETCH_PDF_PAGE_CACHE_DOCUMENTS", "32"))
+
+_process_pool = None
+_process_pool_lock = threading.Lock()
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """
+    Returns the shared worker process pool, creating it on first use.
+    """
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=max(FETCH_WORKERS, 1))
+        return _process_pool
+
+
+def _extract_pdf_pages(pdf_bytes: bytes, page_numbers: List[int]) -> Dict[int, str]:
+    """
+    Extracts the text of the given 0-based pages of a PDF. Runs in a worker process.
+
+    Returns:
+        A dictionary mapping each page number to its text, in the same layout
+        pdfminer's extract_text produces (each page ends with a form feed).
+    """
+    resource_manager = PDFResourceManager()
+    laparams = LAParams()
+    wanted = set(page_numbers)
+    last_wanted = max(wanted)
+    texts = {}
+    for page_number, page in enumerate(PDFPage.get_pages(io.BytesIO(pdf_bytes))):
+        if page_number > last_wanted:
+            break
+        if page_number not in wanted:
+            continue
+        output = io.StringIO()
+        device = TextConverter(resource_manager, output, laparams=laparams)
+        PDFPageInterpreter(resource_manager, device).process_page(page)
+        device.close()
+        texts[page_number] = output.getvalue()
+    return texts
+
+
+# Main-content extraction: when enabled, only the article body found by a
+# readability-style scoring pass is converted to markdown, not the whole page.
+FETCH_MAIN_CONTENT = os.environ.get("FETCH_MAIN_CONTENT", "false").lower() in ("1", "true", "yes")
+MAIN_CONTENT_MIN_CHARS = 250  # Shorter extractions are treated as failures and the full page is used
+
+_BOILERPLATE_TAGS = ("script", "style", "noscript", "template", "iframe", "object", "embed", "canvas", "svg",
+                     "form", "button", "select", "nav", "header", "footer", "aside")
+_UNLIKELY_CANDIDATE = re.compile(r"ad-break|advert|agegate|banner|breadcrumb|combx|comment|community|consent|cookie|"
+                                 r"disqus|footer|gdpr|header|menu|modal|newsletter|pager|pagination|popup|related|"
+                                 r"remark|replies|share|shoutbox|sidebar|skyscraper|social|sponsor|subscribe|widget", re.I)
+_MAYBE_CANDIDATE = re.compile(r"and|article|body|column|content|main|post|entry|story|text", re.I)
+_POSITIVE_HINT = re.compile(r"article|blog|body|content|document|entry|main|page|post|story|text", re.I)
+_NEGATIVE_HINT = re.compile(r"-ad-|banner|combx|comment|contact|cookie|footer|gdpr|masthead|menu|meta|nav|outbrain|"
+                            r"promo|related|share|shoutbox|sidebar|skyscraper|social|sponsor|tags|tool|widget", re.I)
+_TAG_WEIGHTS = {"article": 10, "main": 10, "div": 5, "section": 3, "pre": 3, "td": 3, "blockquote": 3,
+                "address": -3, "ol": -3, "ul": -3, "dl": -3, "dd": -3, "dt": -3, "li": -3,
+                "h1": -5, "h2": -5, "h3": -5, "h4": -5, "h5": -5, "h6": -5, "th": -5}
+
+
+def _class_weight(element) -> int:
+    weight = 0
+    for hint in (element.get("class"), element.get("id")):
+        if hint:
+            if _NEGATIVE_HINT.search(hint):
+                weight -= 25
+            if _POSITIVE_HINT.search(hint):
+                weight += 25
+    return weight
+
+
+def _link_density(element) -> float:
+    text_length = len(element.text_content())
+    if not text_length:
+        return 0.0
+    link_length = sum(len(link.text_content()) for link in element.iter("a"))
+    return link_length / text_length
+
+
+def _extract_main_content(html_content: str) -> str:
+    """
+    Finds the main article body of an HTML page, readability style.
+
+    Scripts, navigation, footers, asides and elements whose class or id marks
+    them as boilerplate (cookie banners, menus, share bars, comments...) are
+    removed first. Every paragraph-like block then scores its parent and
+    grandparent by text length and comma count; the best scoring container,
+    discounted by its link density, is returned together with siblings that
+    score close to it.
+
+    Returns:
+        The HTML of the main content, or `html_content` unchanged when no
+        convincing candidate is found.
+    """
+    try:
+        root = lxml_html.document_fromstring(html_content)
+    except (etree.ParserError, ValueError):
+        return html_content
+
+    for element in list(root.iter(*_BOILERPLATE_TAGS, etree.Comment)):
+        if element.getparent() is not None:
+            element.drop_tree()
+    for element in list(root.iter()):
+        if not isinstance(element.tag, str) or element.tag in ("html", "body", "article", "main") or element.getparent() is None:
+            continue
+        hints = f"{element.get('class', '')} {element.get('id', '')}"
+        if _UNLIKELY_CANDIDATE.search(hints) and not _MAYBE_CANDIDATE.search(hints):
+            element.drop_tree()
+
+    scores = {}
+    for block in root.iter("p", "pre", "td", "blockquote"):
+        text = block.text_content().strip()
+        if len(text) < 25:
+            continue
+        score = 1 + text.count(",") + min(len(text) // 100, 3)
+        parent = block.getparent()
+        grandparent = parent.getparent() if parent is not None else None
+        for ancestor, divider in ((parent, 1), (grandparent, 2)):
+            if ancestor is None or not isinstance(ancestor.tag, str):
+                continue
+            if ancestor not in scores:
+                scores[ancestor] = _TAG_WEIGHTS.get(ancestor.tag, 0) + _class_weight(ancestor)
+            scores[ancestor] += score / divider
+
+    if not scores:
+        return html_content
+    for candidate in scores:
+        scores[candidate] *= 1 - _link_density(candidate)
+    best = max(scores, key=scores.get)
+
+    # Siblings that score well or hold plain prose are usually part of the same article.
+    threshold = max(10, scores[best] * 0.2)
+    parent = best.getparent()
+    included = []
+    for sibling in (parent if parent is not None else [best]):
+        if not isinstance(sibling.tag, str):
+            continue
+        if sibling is best or scores.get(sibling, 0) >= threshold:
+            included.append(sibling)
+        elif sibling.tag == "p":
+            text = sibling.text_content()
+            if len(text) > 80 and _link_density(sibling) < 0.25:
+                included.append(sibling)
+
+    if sum(len(element.text_content()) for element in included) < MAIN_CONTENT_MIN_CHARS:
+        return html_content
+    return "<div>" + "".join(lxml_html.tostring(element, encoding="unicode", with_tail=False) for element in included) + "</div>"
+
+
+def _html_to_markdown(html_content: str, main_content: bool = False) -> str:
+    """
+    Converts HTML to markdown with html2text, optionally keeping only the main content. Runs in a worker process.
+    """
+    if main_content:
+        html_content = _extract_main_content(html_content)
+    text_maker = html2text.HTML2Text()
+    text_maker.body_width = 0  # Disable line wrapping
+    return text_maker.handle(html_content)
+
+
+def _count_pdf_pages(pdf_bytes: bytes) -> int:
+    document = PDFDocument(PDFParser(io.BytesIO(pdf_bytes)))
+    count = (resolve1(document.catalog.get('Pages')) or {}).get('Count')
+    if isinstance(count, int):
+        return count
+    return sum(1 for _ in PDFPage.create_pages(document))
+
+
+class PdfPageCache:
+    """
+    An LRU cache of extracted PDF page text, keyed by URL.
+
+    Keeps the page count and every page extracted so far for the most recently
+    used `max_documents` PDFs, so a follow-up request for another page range of
+    the same document only extracts the new pages, and a repeated range skips
+    the download entirely.
+    """
+
+    def __init__(self, max_documents: int):
+        self.max_documents = max_documents
+        self._documents = OrderedDict()  # url -> (page_count, {page_number: text})
+        self._lock = threading.Lock()
+
+    def get(self, url: str):
+        """
+        Returns (page_count, pages) for `url`, or None if nothing is cached.
+        """
+        with self._lock:
+            entry = self._documents.get(url)
+            if entry is None:
+                return None
+            self._documents.move_to_end(url)
+            return entry[0], dict(entry[1])
+
+    def put(self, url: str, page_count: int, pages: Dict[int, str]) -> None:
+        """
+        Adds extracted `pages` to the entry for `url`, evicting the least recently used document if full.
+        """
+        if self.max_documents <= 0:
+            return
+        with self._lock:
+            _, cached_pages = self._documents.get(url, (page_count, {}))
+            cached_pages.update(pages)
+            self._documents[url] = (page_count, cached_pages)
+            self._documents.move_to_end(url)
+            while len(self._documents) > self.max_documents:
+                self._documents.popitem(last=False)
+
+
+pdf_page_cache = PdfPageCache(PDF_PAGE_CACHE_DOCUMENTS)
+
+
+def _page_range(page_count: int, page_start: Optional[int], page_end: Optional[int]) -> List[int]:
+    # Converts the 1-based inclusive page range of fetch_and_clean into 0-based page numbers.
+    first = (page_start or 1) - 1
+    last = min(page_end or page_count, page_count)
+    return list(range(first, last))
+
+
+def _join_pdf_pages(page_count: int, page_numbers: List[int], pages: Dict[int, str], ranged: bool) -> str:
+    text = "".join(pages[page_number] for page_number in page_numbers)
+    if ranged:
+        if not page_numbers:
+            return f"[No pages in the requested range; the document has {page_count} pages]"
+        text = f"[Pages {page_numbers[0] + 1}-{page_numbers[-1] + 1} of {page_count}]\n\n{text}"
+    return text
+
 
-        if 'application/pdf' in content_type:
-            # Handle PDF content
-            pdf_file = io.BytesIO(response.content)
-            text = extract_text(pdf_file)
+def _cached_pdf_text(url: str, page_start: Optional[int], page_end: Optional[int]) -> Optional[str]:
+    """
+    Returns the requested pages of a previously extracted PDF, or None if any of them is missing.
+    """
+    cached = pdf_page_cache.get(url)
+    if cached is None:
+        return None
+    page_count, pages = cached
+    page_numbers = _page_range(page_count, page_start, page_end)
+    if any(page_number not in pages for page_number in page_numbers):
+        return None
+    return _join_pdf_pages(page_count, page_numbers, pages, page_start is not None or page_end is not None)
+
+
+def _pool_result(futures: list, deadline: Optional[float]) -> list:
+    """
+    Waits for worker process results, raising TimeoutError once `deadline` (a time.monotonic() value) passes.
+
+    On timeout the tasks that have not started yet are cancelled; a task already
+    running finishes in its worker, which the pool size keeps bounded.
+    """
+    results = []
+    try:
+        for future in futures:
+            remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+            results.append(future.result(timeout=remaining))
+    except FutureTimeoutError:
+        for future in futures:
+            future.cancel()
+        raise TimeoutError("Cleaning the document ran past its deadline.")
+    return results
+
+
+def _extract_pdf_text(document: FetchedDocument, page_start: Optional[int], page_end: Optional[int],
+                      deadline: Optional[float] = None) -> str:
+    """
+    Extracts the requested pages of a downloaded PDF, in parallel across the process pool.
+
+    Pages already in the page cache are reused; the rest are split into chunks
+    that the worker processes extract concurrently.
+    """
+    cached = pdf_page_cache.get(document.url) if not document.truncated else None
+    if cached is not None:
+        page_count, pages = cached
+    else:
+        page_count, pages = _count_pdf_pages(document.content), {}
+
+    page_numbers = _page_range(page_count, page_start, page_end)
+    missing = [page_number for page_number in page_numbers if page_number not in pages]
+    if missing:
+        chunk_size = max(PDF_MIN_PAGES_PER_TASK, math.ceil(len(missing) / max(FETCH_WORKERS, 1)))
+        pool = _get_process_pool()
+        futures = [
+            pool.submit(_extract_pdf_pages, document.content, missing[i:i + chunk_size])
+            for i in range(0, len(missing), chunk_size)
+        ]
+        extracted = {}
+        for chunk in _pool_result(futures, deadline):
+            extracted.update(chunk)
+        pages.update(extracted)
+        if not document.truncated:
+            pdf_page_cache.put(document.url, page_count, extracted)
+
+    return _join_pdf_pages(page_count, page_numbers, pages, page_start is not None or page_end is not None)
+
+
+def _clean_document(document: FetchedDocument, page_start: Optional[int] = None, page_end: Optional[int] = None,
+                    deadline: Optional[float] = None) -> str:
+    """
+    Converts a downloaded document to text: PDFs via pdfminer, everything else via html2text.
+
+    With a `deadline` (a time.monotonic() value), TimeoutError is raised if the conversion is not done by then.
+    """
+    if document.is_pdf:
+        # Handle PDF content
+        try:
+            text = _extract_pdf_text(document, page_start, page_end, deadline)
+        except TimeoutError:
+            raise
+        except Exception:
+            if not document.truncated:
+                raise
+            text = ""  # A truncated PDF is usually missing its cross-reference table
+    else:
+        # Handle HTML content (or default to HTML if content type is unknown)
+        future = _get_process_pool().submit(_html_to_markdown, document.text(), FETCH_MAIN_CONTENT)
+        text = _pool_result([future], deadline)[0]
+
+    if document.truncated:
+        text = f"[Truncated: download stopped early, {document.truncated_reason}. The text below is partial.]\n\n{text}"
+    return text
+
+
+# Persistent cache of cleaned documents, revalidated with conditional requests.
+DOCUMENT_CACHE_DIR = os.environ.get("FETCH_CACHE_DIR", os.path.join(os.path.expanduser("~"), ".cache", "mcp_searxng_search"))
+DOCUMENT_CACHE_MAX_BYTES = int(os.environ.get("FETCH_CACHE_MAX_BYTES", str(256 * 1024 * 1024)))  # 0 disables the cache
+
+
+class DocumentCache:
+    """
+    A persistent URL -> cleaned text cache stored in SQLite, evicted LRU under a disk budget.
+
+    Each entry keeps the ETag, Last-Modified and Content-Type the document was
+    served with. Entries are never served blindly: the caller revalidates them
+    with If-None-Match/If-Modified-Since and only reuses the text on a 304, which
+    skips both the download and the html2text/pdfminer conversion.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int):
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._db = None
+        if max_bytes > 0:
+            os.makedirs(cache_dir, exist_ok=True)
+            self._db = sqlite3.connect(os.path.join(cache_dir, "documents.sqlite3"), check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS documents ("
+                "url TEXT, variant TEXT, etag TEXT, last_modified TEXT, content_type TEXT, "
+                "text TEXT, size INTEGER, last_access REAL, PRIMARY KEY (url, variant))"
+            )
+            self._db.commit()
+
+    def get(self, url: str, variant: str) -> Optional[Dict[str, Any]]:
+        """
+        Returns the cached entry for `url` and `variant`, or None.
+        """
+        if self._db is None:
+            return None
+        with self._lock:
+            row = self._db.execute(
+                "SELECT etag, last_modified, content_type, text FROM documents WHERE url = ? AND variant = ?",
+                (url, variant),
+            ).fetchone()
+        if row is None:
+            return None
+        return {'etag': row[0], 'last_modified': row[1], 'content_type': row[2], 'text': row[3]}
+
+    def touch(self, url: str, variant: str) -> None:
+        """
+        Marks an entry as recently used after a successful revalidation.
+        """
+        if self._db is None:
+            return
+        with self._lock:
+            self._db.execute("UPDATE documents SET last_access = ? WHERE url = ? AND variant = ?", (time.time(), url, variant))
+            self._db.commit()
+
+    def put(self, url: str, variant: str, document: FetchedDocument, text: str) -> None:
+        """
+        Stores the cleaned `text` of `document`, then evicts least recently used entries over the budget.
+        """
+        if self._db is None:
+            return
+        size = len(text.encode('utf-8'))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO documents (url, variant, etag, last_modified, content_type, text, size, last_access) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, variant, document.etag, document.last_modified, document.content_type, text, size, time.time()),
+            )
+            total = self._db.execute("SELECT COALESCE(SUM(size), 0) FROM documents").fetchone()[0]
+            if total > self.max_bytes:
+                rows = self._db.execute("SELECT url, variant, size FROM documents ORDER BY last_access").fetchall()
+                for old_url, old_variant, old_size in rows:
+                    if total <= self.max_bytes:
+                        break
+                    self._db.execute("DELETE FROM documents WHERE url = ? AND variant = ?", (old_url, old_variant))
+                    total -= old_size
+            self._db.commit()
+
+
+document_cache = DocumentCache(DOCUMENT_CACHE_DIR, DOCUMENT_CACHE_MAX_BYTES)
+
+
+DOCUMENT_STORE_MAX_CHARS = int(os.environ.get("DOCUMENT_STORE_MAX_CHARS", str(20 * 1000 * 1000)))
+
+
+class DocumentStore:
+    """
+    An in-memory LRU store of the cleaned text of fetched documents, keyed by URL and PDF page range.
+
+    Lets read_document page through a document in windows without fetching or
+    converting it again. The text of a page range is stored apart from the full
+    document, so offsets given for a ranged fetch stay valid. The total number of
+    characters held is bounded; the least recently read documents are evicted first.
+    """
+
+    def __init__(self, max_chars: int):
+        self.max_chars = max_chars
+        self._documents = OrderedDict()  # (url, page_start, page_end) -> text
+        self._total_chars = 0
+        self._lock = threading.Lock()
+
+    def get(self, url: str, page_start: Optional[int] = None, page_end: Optional[int] = None) -> Optional[str]:
+        key = (url, page_start, page_end)
+        with self._lock:
+            text = self._documents.get(key)
+            if text is not None:
+                self._documents.move_to_end(key)
             return text
-        else:
-            # Handle HTML content (or default to HTML if content type is unknown)
-            html_content = response.text
-            text_maker = html2text.HTML2Text()
-            text_maker.body_width = 0  # Disable line wrapping
-            markdown_text = text_maker.handle(html_content)
-            return markdown_text
 
+    def put(self, url: str, text: str, page_start: Optional[int] = None, page_end: Optional[int] = None) -> None:
+        if len(text) > self.max_chars:
+            return
+        key = (url, page_start, page_end)
+        with self._lock:
+            previous = self._documents.pop(key, None)
+            if previous is not None:
+                self._total_chars -= len(previous)
+            self._documents[key] = text
+            self._total_chars += len(text)
+            while self._total_chars > self.max_chars:
+                _, evicted = self._documents.popitem(last=False)
+                self._total_chars -= len(evicted)
+
+
+document_store = DocumentStore(DOCUMENT_STORE_MAX_CHARS)
+
+
+def _document_variant(page_start: Optional[int], page_end: Optional[int]) -> str:
+    # Distinguishes cache entries of the same URL fetched with different page ranges or extraction modes.
+    variant = f"pages:{page_start or ''}-{page_end or ''}"
+    return f"main:{variant}" if FETCH_MAIN_CONTENT else variant
+
+
+def _fetch_document(url: str, page_start: Optional[int] = None, page_end: Optional[int] = None,
+                    deadline: Optional[float] = None) -> Tuple[Optional[str], Optional[FetchedDocument]]:
+    """
+    The download stage of fetch_and_clean.
+
+    PDF pages already in the in-memory page cache are returned directly. Otherwise
+    a document in the persistent cache is revalidated with a conditional request,
+    and its cached text is returned on a 304. A download still running at
+    `deadline` (a time.monotonic() value) raises TimeoutError.
+
+    Returns:
+        (text, None) when current cleaned text was found in a cache, otherwise
+        (None, document) with the downloaded document still to be cleaned.
+    """
+    if page_start is not None or page_end is not None:
+        cached_text = _cached_pdf_text(url, page_start, page_end)
+        if cached_text is not None:
+            return cached_text, None
+
+    variant = _document_variant(page_start, page_end)
+    cached = document_cache.get(url, variant)
+    headers = {}
+    if cached is not None:
+        if cached['etag']:
+            headers['If-None-Match'] = cached['etag']
+        if cached['last_modified']:
+            headers['If-Modified-Since'] = cached['last_modified']
+
+    document = _download(url, headers=headers or None, deadline=deadline)
+    if document.not_modified and cached is not None:
+        document_cache.touch(url, variant)
+        document_store.put(url, cached['text'], page_start, page_end)
+        return cached['text'], None
+    return None, document
+
+
+def _clean_and_store(document: FetchedDocument, page_start: Optional[int] = None, page_end: Optional[int] = None,
+                     deadline: Optional[float] = None) -> str:
+    """
+    The cleaning stage of fetch_and_clean: converts the document and stores the text in the document cache.
+    """
+    text = _clean_document(document, page_start, page_end, deadline)
+    if not document.truncated and (document.etag or document.last_modified):
+        document_cache.put(document.url, _document_variant(page_start, page_end), document, text)
+    document_store.put(document.url, text, page_start, page_end)
+    return text
+
+
+def _fetch_and_clean(url: str, page_start: Optional[int] = None, page_end: Optional[int] = None,
+                     deadline: Optional[float] = None) -> str:
+    """
+    Downloads and cleans a URL, reusing cached text whenever it is still current.
+
+    With a `deadline` (a time.monotonic() value), TimeoutError is raised if the
+    download or the conversion is still running then.
+    """
+    text, document = _fetch_document(url, page_start, page_end, deadline)
+    if text is not None:
+        return text
+    if deadline is not None and time.monotonic() > deadline:
+        raise TimeoutError(f"Fetching {url} ran past its deadline.")
+    return _clean_and_store(document, page_start, page_end, deadline)
+
+
+def _check_page_range(page_start: Optional[int], page_end: Optional[int]) -> None:
+    if page_start is not None and page_start < 1:
+        raise McpError(ErrorData(INVALID_PARAMS, "page_start must be 1 or greater."))
+    if page_end is not None and page_end < (page_start or 1):
+        raise McpError(ErrorData(INVALID_PARAMS, "page_end must not be lower than page_start."))
+
+
+def _read_document_arguments(page_start: Optional[int], page_end: Optional[int]) -> str:
+    # The page range arguments a read_document call needs to continue a ranged fetch, if any.
+    arguments = ""
+    if page_start is not None:
+        arguments += f"page_start={page_start}, "
+    if page_end is not None:
+        arguments += f"page_end={page_end}, "
+    return arguments
+
+
+@mcp.tool()
+async def fetch_and_clean(url: str, page_start: Optional[int] = None, page_end: Optional[int] = None, max_chars: Optional[int] = None) -> str:
+    """
+    Fetches content from a URL, determines the content type (HTML or PDF),
+    cleans the text, and returns the cleaned text.
+
+    Downloads are streamed and capped in size and time; if a cap is hit, the
+    text extracted so far is returned with a "[Truncated: ...]" notice in front.
+    PDF pages are extracted in parallel worker processes.
+
+    Args:
+        url: The URL to fetch and clean.
+        page_start: For PDFs, the first page to extract (1-based). Defaults to the first page.
+        page_end: For PDFs, the last page to extract (inclusive). Defaults to the last page.
+        max_chars: The maximum number of characters to return. The rest of the document
+            (or of the page range) can then be read with read_document. Defaults to returning everything.
+
+    Returns:
+        The cleaned text content of the URL. When a page range is given for a PDF,
+        the text starts with a "[Pages X-Y of N]" line.
+    """
+    _check_page_range(page_start, page_end)
+    if max_chars is not None and max_chars <= 0:
+        raise McpError(ErrorData(INVALID_PARAMS, "max_chars must be greater than 0."))
+
+    try:
+        text = await asyncio.to_thread(_fetch_and_clean, url, page_start, page_end)
+        if max_chars is not None and len(text) > max_chars:
+            text = f"{text[:max_chars]}\n\n[Showing characters 0-{max_chars} of {len(text)}. Call read_document with {_read_document_arguments(page_start, page_end)}offset={max_chars} to continue.]"
+        return text
+    except DownloadRejected as e:
+        raise McpError(ErrorData(INVALID_PARAMS, f"Refused to fetch URL: {str(e)}"))
     except requests.exceptions.RequestException as e:
         raise McpError(ErrorData(INTERNAL_ERROR, f"Error fetching URL: {str(e)}"))
     except Exception as e:
         raise McpError(ErrorData(INTERNAL_ERROR, f"Unexpected error: {str(e)}"))
 
 
+def _describe_fetch_error(error: Exception) -> str:
+    # Same wording as the errors raised by fetch_and_clean.
+    if isinstance(error, DownloadRejected):
+        return f"Refused to fetch URL: {str(error)}"
+    if isinstance(error, requests.exceptions.RequestException):
+        return f"Error fetching URL: {str(error)}"
+    return f"Unexpected error: {str(error)}"
+
+
+@mcp.tool()
+async def fetch_and_clean_many(urls: List[str], max_concurrency: int = 8, max_per_host: int = 2, timeout: float = 60) -> List[Dict[str, str]]:
+    """
+    Fetches and cleans several URLs concurrently, like fetch_and_clean does for one.
+
+    Downloads run at most `max_concurrency` at a time overall and `max_per_host`
+    at a time per host; HTML conversion and PDF extraction run in worker processes.
+    A failing or slow URL does not abort the batch, it gets an error entry instead.
+    The download is read in small pieces with the clock checked in between, and
+    the wait for its conversion is cut off at the same deadline, so a URL never
+    takes much longer than `timeout`. It stops downloading before its slot is
+    given to the next one, so the limits hold for timed-out URLs too.
+
+    Args:
+        urls: The URLs to fetch and clean.
+        max_concurrency: The maximum number of URLs fetched at the same time. Defaults to 8.
+        max_per_host: The maximum number of URLs fetched from the same host at the same time. Defaults to 2.
+        timeout: The maximum time in seconds to spend downloading and cleaning each URL,
+            counted from when its download starts. Defaults to 60.
+
+    Returns:
+        A list with one dictionary per URL, in the same order as `urls`, containing
+        the URL and either its cleaned "content" or an "error" message.
+    """
+    if not urls:
+        raise McpError(ErrorData(INVALID_PARAMS, "At least one URL must be submitted."))
+    if max_concurrency <= 0 or max_per_host <= 0:
+        raise McpError(ErrorData(INVALID_PARAMS, "max_concurrency and max_per_host must be greater than 0."))
+    if timeout <= 0:
+        raise McpError(ErrorData(INVALID_PARAMS, "timeout must be greater than 0."))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    host_semaphores = {}
+
+    async def fetch_one(url: str) -> Dict[str, str]:
+        host = urlparse(url).netloc.lower()
+        host_semaphore = host_semaphores.setdefault(host, asyncio.Semaphore(max_per_host))
+        async with host_semaphore, semaphore:
+            try:
+                # The deadline ends the download in the worker thread itself, so the slot is only
+                # released once that thread is done.
+                content = await asyncio.to_thread(_fetch_and_clean, url, None, None, time.monotonic() + timeout)
+            except TimeoutError:
+                return {'url': url, 'error': f"Timed out after {timeout:g} seconds."}
+            except Exception as e:
+                return {'url': url, 'error': _describe_fetch_error(e)}
+        return {'url': url, 'content': content}
+
+    return list(await asyncio.gather(*(fetch_one(url) for url in urls)))
+
+
 @mcp.tool()
 def searxng_news_search(query: str, time_range: Optional[Literal["day", "week", "month", "year"]] = None, max_results: int = 30) -> List[Dict[str, str]]:
     """
@@ -188,40 +1435,16 @@ def searxng_news_search(query: str, time_range: Optional[Literal["day", "week",
     if max_results <= 0:
         raise McpError(ErrorData(INVALID_PARAMS, "max_results must be greater than 0."))
 
-    search_url = f"{SEARXNG_BASE_URL}/search"
-    headers = {
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Cache-Control': 'no-cache',
-        'Connection': 'keep-alive',
-        'Content-Type': 'application/x-www-form-urlencoded',
-        'Pragma': 'no-cache',
-        'Upgrade-Insecure-Requests': '1',
-        'User-Agent': USER_AGENT
-    }
-
-    time_range_param = f"&time_range={time_range}" if time_range else ""
-    data = f"q={query}&categories=news&language=auto{time_range_param}&safesearch=0&theme=simple"
+    cache_key = search_cache.make_key(query, "news", time_range, max_results)
+    cached_results = search_cache.get(cache_key)
+    if cached_results is not None:
+        return cached_results
 
     try:
-        response = requests.post(search_url, headers=headers, data=data, verify=False, timeout=30)
-        response.raise_for_status()  # Raise HTTPError for bad responses (4xx or 5xx)
-        html_content = response.text
-        soup = BeautifulSoup(html_content, 'html.parser')
-        results = []
-        for article in soup.find_all('article', class_='result')[:max_results]:
-            url_header = article.find('a', class_='url_header')
-            if url_header:
-                url = url_header['href']
-                title = article.find('h3').text.strip() if article.find('h3') else "No Title"
-                description = article.find('p', class_='content').text.strip() if article.find('p', class_='content') else "No Description"
-                results.append({
-                    'title': title,
-                    'url': url,
-                    'content': description
-                })
+        results = _searxng_search_pages(query, "news", time_range, max_results)
         if not results:
             return [{"error": "No news articles found for the given query."}]
+        search_cache.put(cache_key, "news", results)
         return results
     except requests.exceptions.RequestException as e:
         raise McpError(ErrorData(INTERNAL_ERROR, f"Error during search: {str(e)}"))
@@ -247,61 +1470,291 @@ def searxng_file_search(query: str, time_range: Optional[Literal["day", "week",
     if max_results <= 0:
         raise McpError(ErrorData(INVALID_PARAMS, "max_results must be greater than 0."))
 
-    search_url = f"{SEARXNG_BASE_URL}/search"
-    headers = {
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
-        'Accept-Language': 'en-US,en;q=0.9',
-        'Cache-Control': 'no-cache',
-        'Connection': 'keep-alive',
-        'Content-Type': 'application/x-www-form-urlencoded',
-        'Pragma': 'no-cache',
-        'Upgrade-Insecure-Requests': '1',
-        'User-Agent': USER_AGENT
-    }
-
-    time_range_param = f"&time_range={time_range}" if time_range else ""
-    data = f"q={query}&categories=files&language=auto{time_range_param}&safesearch=0&theme=simple"
+    cache_key = search_cache.make_key(query, "files", time_range, max_results)
+    cached_results = search_cache.get(cache_key)
+    if cached_results is not None:
+        return cached_results
 
     try:
-        response = requests.post(search_url, headers=headers, data=data, verify=False, timeout=30)
-        response.raise_for_status()
-        html_content = response.text
-        soup = BeautifulSoup(html_content, 'html.parser')
-        results = []
-        for article in soup.find_all('article', class_='result', limit=max_results):
-            result = {}
-            url_header = article.find('a', class_='url_header')
-            if url_header:
-                result['url'] = url_header['href']
-                result['title'] = article.find('h3').text.strip() if article.find('h3') else "No Title"
-
-            altlink = article.find('p', class_='altlink')
-            if altlink:
-                magnet_link = altlink.find('a', href=lambda href: href and "magnet:" in href)
-                if magnet_link:
-                    result['magnet'] = magnet_link['href']
-
-            stat_elements = article.find_all('p', class_='stat')
-            seeders = "N/A"
-            leechers = "N/A"
-            if len(stat_elements) >= 1:
-                seeder_element = stat_elements[0].find('span', class_='badge')
-                if seeder_element:
-                    seeders = seeder_element.text.replace("Seeder", "").strip()
-            if len(stat_elements) >= 2:
-                leech_element = stat_elements[1].find('span', class_='badge')
-                if leech_element:
-                    leechers = leech_element.text.replace("Leecher", "").strip()
-
-            result['seeders'] = seeders
-            result['leechers'] = leechers
-
-            results.append(result)
-
+        results = _searxng_search_pages(query, "files", time_range, max_results)
         if not results:
             return [{"error": "No files found for the given query."}]
+        search_cache.put(cache_key, "files", results)
         return results
     except requests.exceptions.RequestException as e:
         raise McpError(ErrorData(INTERNAL_ERROR, f"Error during search: {str(e)}"))
     except Exception as e:
         raise McpError(ErrorData(INTERNAL_ERROR, f"Unexpected error: {str(e)}"))
+
+
+@mcp.tool()
+async def searxng_multi_search(queries: List[str], categories: Optional[List[Literal["general", "news"]]] = None, time_range: Optional[Literal["day", "week", "month", "year"]] = None, max_results: int = 10, max_concurrency: int = 5) -> Dict[str, Any]:
+    """
+    Runs several searches concurrently using a SearxNG instance and merges their results.
+
+    Every query is searched in every requested category, at most `max_concurrency`
+    searches at a time, so the total wall time is close to the slowest search
+    rather than the sum of all of them.
+
+    Args:
+        queries: The search queries.
+        categories: The categories to search each query in. Valid values are "general" and "news". Defaults to ["general"].
+        time_range: The time range to filter news results by. Valid values are "day", "week", "month", and "year". Defaults to no time limit.
+        max_results: The maximum number of results to return per search. Defaults to 10.
+        max_concurrency: The maximum number of searches running at the same time. Defaults to 5.
+
+    Returns:
+        A dictionary with a "searches" list holding the query, category and results
+        (or error) of each individual search, and a "merged" list of all results
+        deduplicated by URL, interleaved so the top results of every search come first.
+    """
+    if max_results <= 0:
+        raise McpError(ErrorData(INVALID_PARAMS, "max_results must be greater than 0."))
+    if max_concurrency <= 0:
+        raise McpError(ErrorData(INVALID_PARAMS, "max_concurrency must be greater than 0."))
+
+    queries = list(dict.fromkeys(query for query in queries if query and query.strip()))
+    if not queries:
+        raise McpError(ErrorData(INVALID_PARAMS, "At least one non-empty query must be submitted."))
+    categories = list(dict.fromkeys(categories or ["general"]))
+    for category in categories:
+        if category not in ("general", "news"):
+            raise McpError(ErrorData(INVALID_PARAMS, f"Unsupported category: {category}. Supported categories are: general, news"))
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run_search(query: str, category: str) -> Dict[str, Any]:
+        async with semaphore:
+            try:
+                if category == "news":
+                    results = await asyncio.to_thread(searxng_news_search, query, time_range, max_results)
+                else:
+                    results = await asyncio.to_thread(searxng_search, query, max_results)
+            except McpError as e:
+                return {"query": query, "category": category, "error": e.error.message}
+        if len(results) == 1 and "error" in results[0]:
+            return {"query": query, "category": category, "error": results[0]["error"]}
+        return {"query": query, "category": category, "results": results}
+
+    searches = await asyncio.gather(*(run_search(query, category) for query in queries for category in categories))
+
+    merged = []
+    merged_by_url = {}
+    result_lists = [search.get("results", []) for search in searches]
+    for rank in range(max((len(results) for results in result_lists), default=0)):
+        for search, results in zip(searches, result_lists):
+            if rank >= len(results):
+                continue
+            result = results[rank]
+            url = result.get("url")
+            if not url:
+                continue
+            if url in merged_by_url:
+                if search["query"] not in merged_by_url[url]["queries"]:
+                    merged_by_url[url]["queries"].append(search["query"])
+                continue
+            merged_result = dict(result, queries=[search["query"]])
+            merged_by_url[url] = merged_result
+            merged.append(merged_result)
+
+    return {"searches": list(searches), "merged": merged}
+
+
+@mcp.tool()
+async def search_and_read(query: str, top_k: int = 5, max_chars_per_doc: int = 4000, max_concurrency: int = 5, timeout: float = 60) -> List[Dict[str, Any]]:
+    """
+    Searches the web using a SearxNG instance and reads the top results in one call.
+
+    The top `top_k` result URLs are downloaded concurrently and cleaned like
+    fetch_and_clean does. Downloads and cleaning form a pipeline: a document is
+    converted as soon as it arrives, while later downloads are still in flight.
+
+    Args:
+        query: The search query.
+        top_k: The number of top search results to read. Defaults to 5.
+        max_chars_per_doc: The maximum number of characters of cleaned text returned per document. Defaults to 4000.
+        max_concurrency: The maximum number of documents downloaded at the same time. Defaults to 5.
+        timeout: The maximum time in seconds to spend downloading each document. Defaults to 60.
+
+    Returns:
+        A list with one dictionary per result, in search rank order, containing the
+        title, URL, search snippet, and either the cleaned "content" (cut to
+        `max_chars_per_doc`, with "content_truncated" and "total_chars" telling how
+        much was left out, readable with read_document) or an "error" message.
+    """
+    if top_k <= 0 or max_chars_per_doc <= 0 or max_concurrency <= 0:
+        raise McpError(ErrorData(INVALID_PARAMS, "top_k, max_chars_per_doc and max_concurrency must be greater than 0."))
+    if timeout <= 0:
+        raise McpError(ErrorData(INVALID_PARAMS, "timeout must be greater than 0."))
+
+    search_results = await asyncio.to_thread(searxng_search, query, top_k)
+    if len(search_results) == 1 and "error" in search_results[0]:
+        return search_results
+
+    documents = [
+        {'title': result['title'], 'url': result['url'], 'snippet': result['content']}
+        for result in search_results[:top_k]
+    ]
+    queue = asyncio.Queue()
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def download(index: int) -> None:
+        # Producer: downloads (or revalidates) one document and queues it for cleaning.
+        async with semaphore:
+            try:
+                deadline = time.monotonic() + timeout
+                text, document = await asyncio.to_thread(_fetch_document, documents[index]['url'], None, None, deadline)
+            except TimeoutError:
+                await queue.put((index, None, None, f"Timed out after {timeout:g} seconds."))
+                return
+            except Exception as e:
+                await queue.put((index, None, None, _describe_fetch_error(e)))
+                return
+        await queue.put((index, text, document, None))
+
+    async def clean() -> None:
+        # Consumer: converts downloaded documents while other downloads continue.
+        while True:
+            item = await queue.get()
+            if item is None:
+                return
+            index, text, document, error = item
+            if error is None and text is None:
+                try:
+                    text = await asyncio.to_thread(_clean_and_store, document)
+                except Exception as e:
+                    error = _describe_fetch_error(e)
+            if error is not None:
+                documents[index]['error'] = error
+                continue
+            documents[index]['content'] = text[:max_chars_per_doc]
+            documents[index]['content_truncated'] = len(text) > max_chars_per_doc
+            documents[index]['total_chars'] = len(text)
+
+    cleaners = [asyncio.create_task(clean()) for _ in range(max(min(FETCH_WORKERS, len(documents)), 1))]
+    await asyncio.gather(*(download(index) for index in range(len(documents))))
+    for _ in cleaners:
+        await queue.put(None)
+    await asyncio.gather(*cleaners)
+    return documents
+
+
+_HEADING_PATTERN = re.compile(r"^(#{1,6})[ \t]+(.+)$", re.MULTILINE)
+
+
+def _document_sections(text: str, first_page: int = 1) -> List[Dict[str, Any]]:
+    """
+    Splits cleaned text into sections.
+
+    Markdown headings start sections, each running until the next heading of the
+    same or a higher level. Text without headings, such as PDF output, is split
+    into one section per page instead, numbered from `first_page`.
+    """
+    headings = [(match.start(), len(match.group(1)), match.group(2).strip()) for match in _HEADING_PATTERN.finditer(text)]
+    if not headings:
+        sections = []
+        offset = 0
+        for page_number, page in enumerate(text.split("\f")):
+            if page.strip():
+                sections.append({'heading': f"Page {page_number + first_page}", 'level': 1, 'offset': offset, 'length': len(page)})
+            offset += len(page) + 1
+        return sections
+
+    sections = []
+    for index, (start, level, heading) in enumerate(headings):
+        end = len(text)
+        for next_start, next_level, _ in headings[index + 1:]:
+            if next_level <= level:
+                end = next_start
+                break
+        sections.append({'heading': heading, 'level': level, 'offset': start, 'length': end - start})
+    return sections
+
+
+async def _stored_document(url: str, page_start: Optional[int] = None, page_end: Optional[int] = None) -> str:
+    # Returns the stored text of `url` (or of its PDF page range), fetching and cleaning it on first use.
+    _check_page_range(page_start, page_end)
+    text = document_store.get(url, page_start, page_end)
+    if text is not None:
+        return text
+    try:
+        text = await asyncio.to_thread(_fetch_and_clean, url, page_start, page_end)
+    except Exception as e:
+        code = INVALID_PARAMS if isinstance(e, DownloadRejected) else INTERNAL_ERROR
+        raise McpError(ErrorData(code, _describe_fetch_error(e)))
+    document_store.put(url, text, page_start, page_end)
+    return text
+
+
+@mcp.tool()
+async def read_document(url: str, offset: int = 0, length: int = 4000, section: Optional[int] = None,
+                        page_start: Optional[int] = None, page_end: Optional[int] = None) -> str:
+    """
+    Reads a window of a document's cleaned text without fetching or converting it again.
+
+    Documents fetched by fetch_and_clean, fetch_and_clean_many or search_and_read
+    are kept server-side; other URLs are fetched and cleaned on first use.
+
+    Args:
+        url: The URL of the document.
+        offset: The character offset to start reading at. Defaults to 0.
+        length: The maximum number of characters to return. Defaults to 4000.
+        section: The index of a section to read instead of an offset (see get_document_outline).
+            `offset` then counts from the start of the section.
+        page_start: For PDFs, the first page of the range fetched with fetch_and_clean. Offsets then
+            count in the text of that range. Defaults to the whole document.
+        page_end: For PDFs, the last page of that range. Defaults to the whole document.
+
+    Returns:
+        The requested text, preceded by a line giving its character range in the document.
+    """
+    if offset < 0 or length <= 0:
+        raise McpError(ErrorData(INVALID_PARAMS, "offset must not be negative and length must be greater than 0."))
+
+    text = await _stored_document(url, page_start, page_end)
+    start, end, label = 0, len(text), ""
+    if section is not None:
+        sections = _document_sections(text, page_start or 1)
+        if not 0 <= section < len(sections):
+            raise McpError(ErrorData(INVALID_PARAMS, f"Section {section} does not exist; the document has {len(sections)} sections."))
+        start = sections[section]['offset']
+        end = start + sections[section]['length']
+        label = f"Section {section} ({sections[section]['heading']}), "
+
+    window_start = min(start + offset, end)
+    window_end = min(window_start + length, end)
+    header = f"[{label}characters {window_start}-{window_end} of {len(text)}]"
+    if window_end < end:
+        header = header[:-1] + f"; more follows, continue at {_read_document_arguments(page_start, page_end)}offset={window_end - start}]"
+    return f"{header}\n\n{text[window_start:window_end]}"
+
+
+@mcp.tool()
+async def get_document_outline(url: str, page_start: Optional[int] = None, page_end: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    Lists the sections of a document's cleaned text, for reading them with read_document.
+
+    Args:
+        url: The URL of the document.
+        page_start: For PDFs, the first page to outline. Defaults to the first page.
+        page_end: For PDFs, the last page to outline (inclusive). Defaults to the last page.
+
+    Returns:
+        A list of dictionaries with the index, heading, heading level, character
+        offset and length of each section. Documents without headings, such as
+        PDFs, are split into one section per page.
+    """
+    text = await _stored_document(url, page_start, page_end)
+    return [dict(section, index=index) for index, section in enumerate(_document_sections(text, page_start or 1))]
+
+
+@mcp.tool()
+def searxng_cache_stats() -> Dict[str, int]:
+    """
+    Returns the counters of the search result cache, to help size it.
+
+    Returns:
+        A dictionary with the number of memory hits, disk hits, misses, LRU evictions,
+        TTL expirations, and the current and maximum number of cached entries.
+    """
+    return search_cache.stats()
@@ -0,0 +1,97 @@
+"""
+Tests that the fetch time limits hold against a slow local server.
+
+    uv run --extra test pytest tests
+"""
+import asyncio
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "src"))
+os.environ.setdefault("SEARXNG_BASE_URL", "http://127.0.0.1:8888")
+os.environ["FETCH_CACHE_MAX_BYTES"] = "0"
+
+from mcp_searxng_search import server  # noqa: E402
+
+
+class SlowHandler(BaseHTTPRequestHandler):
+    """Trickles 1000 bytes every 0.5 s on /trickle, and stalls after a first write on /stall."""
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        try:
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.end_headers()
+            if self.path == "/stall":
+                self.wfile.write(b"<p>start</p>")
+                self.wfile.flush()
+                time.sleep(30)
+                return
+            for _ in range(120):
+                self.wfile.write(b"<p>" + b"x" * 993 + b"</p>")
+                self.wfile.flush()
+                time.sleep(0.5)
+        except OSError:
+            pass
+
+
+@pytest.fixture(scope="module")
+def slow_server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), SlowHandler)
+    httpd.daemon_threads = True
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+@pytest.mark.parametrize("path", ["/trickle", "/stall"])
+def test_fetch_and_clean_many_timeout(slow_server, path):
+    started = time.monotonic()
+    results = asyncio.run(server.fetch_and_clean_many([slow_server + path], timeout=2))
+    assert time.monotonic() - started < 4
+    assert results[0]["error"] == "Timed out after 2 seconds."
+
+
+@pytest.mark.parametrize("path", ["/trickle", "/stall"])
+def test_download_time_cap_truncates(slow_server, path, monkeypatch):
+    monkeypatch.setattr(server, "FETCH_MAX_SECONDS", 1.5)
+    started = time.monotonic()
+    text = asyncio.run(server.fetch_and_clean(slow_server + path))
+    assert time.monotonic() - started < 3.5
+    assert text.startswith("[Truncated: download stopped early, time limit of 1.5 seconds reached.")
+
+
+def test_cleaning_stops_at_deadline(monkeypatch):
+    document = server.FetchedDocument(url="http://example.invalid/", content=b"<p>text</p>", content_type="text/html", encoding=None)
+
+    class SlowFuture:
+        def __init__(self):
+            self.cancelled = False
+
+        def result(self, timeout=None):
+            time.sleep(timeout)
+            raise server.FutureTimeoutError()
+
+        def cancel(self):
+            self.cancelled = True
+
+    future = SlowFuture()
+
+    class SlowPool:
+        def submit(self, *args):
+            return future
+
+    monkeypatch.setattr(server, "_get_process_pool", lambda: SlowPool())
+    started = time.monotonic()
+    with pytest.raises(TimeoutError):
+        server._clean_document(document, deadline=time.monotonic() + 0.5)
+    assert time.monotonic() - started < 1.5
+    assert future.cancelled